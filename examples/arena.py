@@ -0,0 +1,42 @@
+import random
+import time
+
+from tomachess.participant import Player
+from tomachess.state.results import GameResult
+from tomachess.tournament.arena import ArenaTournament
+
+from helper_functions import assign_random_game_result
+
+
+# Create some dummy players
+players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2800)) for i in range(2000)]
+
+# Create the tournament and let every player join the pairing queue
+tournament = ArenaTournament(participants=players)
+tournament.join(players)
+
+# Simulate the arena: pair the queue, then finish a random selection of the ongoing games
+start = time.perf_counter()
+while len(tournament.states.results) < 20000:
+    tournament.generate_pairings()
+    games = tournament.get_games()
+    for game in random.sample(games, len(games) // 4 + 1):
+        game_result = GameResult.from_game_pairing(game)
+        assign_random_game_result(game_result)
+        tournament.add_game_result(game_result)
+duration = time.perf_counter() - start
+tournament.finish()
+
+# Print the throughput
+game_number = len(tournament.states.results)
+print(f"{game_number} games in {duration:.2f}s ({game_number / duration:.0f} games/s)")
+
+# Print out the top of the final standings
+standings = tournament.get_top_standings(10)
+print("")
+print("-----------------------------")
+print("       Final Standings       ")
+print("-----------------------------")
+print(f"No.  Name\t\tPoints")
+for i, item in enumerate(standings.items):
+    print(f"{i + 1:<3}  {item.participant.name}\t{item.scores[0]}")
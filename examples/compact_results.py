@@ -0,0 +1,49 @@
+import random
+
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.state.results import CompactRounds, FinalizedRoundResult, Results, RoundResult
+from tomachess.tournament.swiss import SwissTournament
+from tomachess.tournament.swiss.tournament import SwissParameters
+
+from helper_functions import assign_random_game_result
+
+
+# Play a small Swiss tournament to get some finished rounds
+random.seed(0)
+players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2800)) for i in range(15)]
+tournament = SwissTournament(participants=players, parameters=SwissParameters(rounds=5))
+rounds: list[FinalizedRoundResult] = []
+while not tournament.is_finished():
+    tournament.generate_pairings()
+    pairings = tournament.get_pairings()
+    assert pairings is not None
+    assert Pairings.is_finalized(pairings)
+    round_result = RoundResult.from_pairings(pairings)
+    for game_result in round_result.items:
+        assign_random_game_result(game_result)
+    assert RoundResult.is_finalized(round_result)
+    tournament.add_round_result(round_result)
+    rounds.append(FinalizedRoundResult.model_validate(round_result.model_dump()))
+
+# The columns give back every round, game by game
+compact_rounds = tournament.states.results.rounds
+assert isinstance(compact_rounds, CompactRounds)
+assert [item.model_dump() for item in compact_rounds] == [item.model_dump() for item in rounds]
+assert [item.model_dump() for item in compact_rounds[1:3]] == [item.model_dump() for item in rounds[1:3]]
+assert compact_rounds[-1].model_dump() == rounds[-1].model_dump()
+assert compact_rounds.get_uuids() == set().union(*(item.get_uuids() for item in rounds))
+
+# Serialize the results to JSON and load them again
+data = tournament.states.results.model_dump_json()
+loaded_results = Results.model_validate_json(data)
+assert loaded_results.model_dump() == tournament.states.results.model_dump()
+assert loaded_results.model_dump_json() == data
+
+# Popping a round and appending it again restores the same columns
+last_round = compact_rounds.pop()
+assert len(compact_rounds) == len(rounds) - 1
+compact_rounds.append(last_round)
+assert [item.model_dump() for item in compact_rounds] == [item.model_dump() for item in rounds]
+
+print(f"{len(compact_rounds)} rounds with {len(compact_rounds.columns)} games survive the round trip")
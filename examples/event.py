@@ -0,0 +1,50 @@
+import random
+from pathlib import Path
+
+from tomachess.batch import Event
+from tomachess.participant import Player
+from tomachess.state.results import RoundResult
+from tomachess.store import JsonStore
+from tomachess.tournament.swiss import SwissTournament
+from tomachess.tournament.swiss.tournament import SwissParameters
+
+from helper_functions import assign_random_game_result
+
+
+if __name__ == "__main__":
+    # Create a shared pool of dummy players
+    random.seed(0)
+    players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2400)) for i in range(240)]
+
+    # Split the pool into rating sections
+    limits = {"Open": 3000, "U2000": 2000, "U1600": 1600, "U1300": 1300}
+    sections = {name: SwissTournament(parameters=SwissParameters(rounds=5)) for name in limits}
+    section_names = {section.uuid: name for name, section in sections.items()}
+    for player in players:
+        name = min((name for name, limit in limits.items() if (player.rating or 0) < limit), key=limits.__getitem__)
+        sections[name].participants.append(player)
+
+    # Create the event, pairing the sections in up to four worker processes
+    event = Event(players=players, sections=sections.values(), max_workers=4)
+
+    # Pair all sections at once and add random results until every section is finished
+    while not event.is_finished():
+        event.generate_pairings()
+        for section in event.sections:
+            pairings = section.get_pairings()
+            assert pairings is not None
+            round_result = RoundResult.from_pairings(pairings)
+            for game_result in round_result.items:
+                assign_random_game_result(game_result)
+            section.add_round_result(round_result)
+
+    # Print the winner of every section
+    for uuid, standings in event.get_standings().items():
+        winner = standings.items[0]
+        print(f"{section_names[uuid]}: {winner.participant.name} ({winner.scores[0]} points)")
+
+    # Save the whole event in one batch and load it again
+    json_store = JsonStore(Path("./examples/event_store"))
+    event.save(json_store, "weekend_event")
+    loaded_event = Event.load(json_store, "weekend_event")
+    print(f"Loaded {len(loaded_event.sections)} sections with {len(loaded_event.players)} players")
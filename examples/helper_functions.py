@@ -43,14 +43,8 @@ def get_result_character(individual_result: IndividualResult) -> str:
 
 def assign_random_game_result(game_result: GameResult) -> None:
     """Assign a random result (white wins, draw or black wins) to a game."""
-    # Assign a pairing allocated bye if there is no opponent
-    if game_result.uuid_1 is None:
-        game_result.result_1 = IndividualResult.UNDEFINED
-        game_result.result_2 = IndividualResult.PAIRING_ALLOCATED_BYE
-        return
-    if game_result.uuid_2 is None:
-        game_result.result_1 = IndividualResult.PAIRING_ALLOCATED_BYE
-        game_result.result_2 = IndividualResult.UNDEFINED
+    # Keep the bye result derived from the pairing if there is no opponent
+    if game_result.uuid_1 is None or game_result.uuid_2 is None:
         return
 
     # Assign a uniformly drawn result
@@ -0,0 +1,56 @@
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.state.results import RoundResult
+from tomachess.tournament.knockout import KnockoutTournament
+
+from helper_functions import assign_random_game_result, print_pairings, print_round_result
+
+
+# Create some dummy players
+players = [
+    Player(name="Alice"),
+    Player(name="Bob"),
+    Player(name="Charlie"),
+    Player(name="Diana"),
+    Player(name="Ethan"),
+    Player(name="Fiona"),
+    Player(name="George"),
+    Player(name="Hannah"),
+    Player(name="Ian")
+]
+
+# Create the tournament
+tournament = KnockoutTournament(participants=players)
+
+# Loop through rounds until the tournament is finished
+while not tournament.is_finished():
+    # Get pairings
+    tournament.generate_pairings()
+    pairings = tournament.get_pairings()
+    assert pairings is not None
+    assert Pairings.is_finalized(pairings)
+
+    # Print pairing
+    print("------------------------")
+    print(f"  Pairing for round {pairings.index[0]}, game {pairings.index[1]}  ")
+    print("------------------------")
+    print_pairings(pairings, tournament)
+
+    # Add results
+    round_result = RoundResult.from_pairings(pairings)
+    for game_result in round_result.items:
+        assign_random_game_result(game_result)
+    assert RoundResult.is_finalized(round_result)
+    tournament.add_round_result(round_result)
+
+    # Print results
+    print("------------------------")
+    print(f"  Results for round {pairings.index[0]}, game {pairings.index[1]}  ")
+    print("------------------------")
+    print_round_result(round_result, tournament)
+
+# Print out the winner
+winner = tournament.get_winner()
+assert winner is not None
+print("")
+print(f"Winner: {tournament.get_participant_dict()[winner].name}")
@@ -1,5 +1,6 @@
 from tomachess.participant import Player, Team
 from tomachess.state import Pairings
+from tomachess.state.pairings import FinalizedGamePairing
 from tomachess.state.team_pairings import TeamPairing
 from tomachess.state.team_results import TeamGameResult
 from tomachess.tournament.round_robin import RoundRobinTeamTournament
@@ -54,13 +55,17 @@ while not tournament.is_finished():
     team_pairings = tournament.get_team_pairings()
     assert team_pairings is not None
 
-    # Assign players to boards
+    # Assign players to boards by creating new versions of the immutable team pairings
     for i, team_pairing in enumerate(team_pairings.items):
-        for j, game_pairing in enumerate(team_pairing.items):
-            assert team_pairing.team_1 is not None and team_pairing.team_2 is not None
-            game_pairing.uuid_1.content = members_dict[team_pairing.team_1][j].uuid
-            game_pairing.uuid_2.content = members_dict[team_pairing.team_2][j].uuid
-        tournament.finalize_team_pairing(i, team_pairing)
+        assert team_pairing.team_1 is not None and team_pairing.team_2 is not None
+        members_1, members_2 = members_dict[team_pairing.team_1], members_dict[team_pairing.team_2]
+        items = tuple(
+            FinalizedGamePairing.from_uuids(uuid_1=members_1[j].uuid, uuid_2=members_2[j].uuid)
+            for j in range(len(team_pairing.items))
+        )
+        tournament.finalize_team_pairing(i, team_pairing.model_copy(update={"items": items}))
+    team_pairings = tournament.get_team_pairings()
+    assert team_pairings is not None
 
     # Print pairing
     print("--------------------------------")
@@ -0,0 +1,66 @@
+from tomachess.classes import PairingBudget
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.state.results import RoundResult
+from tomachess.tournament.swiss import SwissTournament
+from tomachess.tournament.swiss.tournament import SwissParameters
+
+from helper_functions import assign_random_game_result, print_pairings, print_round_result
+
+
+# Create some dummy players
+players = [
+    Player(name="Alice", rating=2310),
+    Player(name="Bob", rating=1980),
+    Player(name="Charlie", rating=2150),
+    Player(name="Diana", rating=1720),
+    Player(name="Ethan", rating=2045),
+    Player(name="Fiona", rating=1890),
+    Player(name="George", rating=2205),
+    Player(name="Hannah", rating=1655),
+    Player(name="Ian", rating=1805)
+]
+
+# Create the tournament
+tournament = SwissTournament(participants=players, parameters=SwissParameters(rounds=5))
+
+# Loop through rounds until the tournament is finished
+round_number = 1
+while not tournament.is_finished():
+    # Get pairings, spending at most a tenth of a second on improving them
+    search_result = tournament.generate_pairings(PairingBudget(seconds=0.1))
+    pairings = tournament.get_pairings()
+    assert pairings is not None
+    assert Pairings.is_finalized(pairings)
+
+    # Print pairing
+    print("------------------------")
+    print(f"  Pairing for round {round_number}  ")
+    print("------------------------")
+    print_pairings(pairings, tournament)
+    print(f"Penalty: {search_result.penalty} ({'optimal' if search_result.optimal else 'best found'})")
+
+    # Add results
+    round_result = RoundResult.from_pairings(pairings)
+    for game_result in round_result.items:
+        assign_random_game_result(game_result)
+    assert RoundResult.is_finalized(round_result)
+    tournament.add_round_result(round_result)
+
+    # Print results
+    print("------------------------")
+    print(f"  Results for round {round_number}  ")
+    print("------------------------")
+    print_round_result(round_result, tournament)
+
+    round_number += 1
+
+# Print out the final standings
+standings = tournament.get_standings()
+print("")
+print("-----------------------------")
+print("       Final Standings       ")
+print("-----------------------------")
+print(f"No.  Name\tPoints\tBuho\tSoBe")
+for i, item in enumerate(standings.items):
+    print(f"{i + 1:<3}  {item.participant.name}\t{item.scores[0]}\t{item.scores[1]}\t{item.scores[2]}")
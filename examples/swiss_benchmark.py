@@ -0,0 +1,38 @@
+import random
+import time
+
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.state.results import RoundResult
+from tomachess.tournament.swiss import SwissTournament
+from tomachess.tournament.swiss.tournament import SwissParameters
+
+from helper_functions import assign_random_game_result
+
+
+# Benchmark the Swiss pairing engine on open-sized fields
+for player_number, rounds in ((300, 9), (1000, 9), (2000, 11)):
+    players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2800)) for i in range(player_number)]
+    tournament = SwissTournament(participants=players, parameters=SwissParameters(rounds=rounds))
+
+    # Time the pairing of every round
+    timings = []
+    while not tournament.is_finished():
+        start = time.perf_counter()
+        tournament.generate_pairings()
+        timings.append(time.perf_counter() - start)
+
+        pairings = tournament.get_pairings()
+        assert pairings is not None
+        assert Pairings.is_finalized(pairings)
+
+        # Add random results
+        round_result = RoundResult.from_pairings(pairings)
+        for game_result in round_result.items:
+            assign_random_game_result(game_result)
+        assert RoundResult.is_finalized(round_result)
+        tournament.add_round_result(round_result)
+
+    # Print the timings
+    print(f"{player_number} players, {rounds} rounds")
+    print(f"\tmean: {sum(timings) / len(timings):.3f}s\tmax: {max(timings):.3f}s")
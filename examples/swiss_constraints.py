@@ -0,0 +1,86 @@
+import random
+from uuid import UUID
+
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.state.results import IndividualResult, RoundResult
+from tomachess.tournament.swiss import SwissTournament
+from tomachess.tournament.swiss.tournament import SwissParameters
+
+from helper_functions import assign_random_game_result
+
+
+def check_round(tournament: SwissTournament) -> None:
+    """Check that no pairing is repeated, colours stay balanced and no one gets a second bye."""
+    games: set[frozenset[UUID]] = set()
+    colours: dict[UUID, list[int]] = {}
+    byes: dict[UUID, int] = {}
+    for round_result in tournament.states.results.rounds:
+        for game_result in round_result.items:
+            if game_result.uuid_2 is None:
+                assert game_result.uuid_1 is not None
+                byes[game_result.uuid_1] = byes.get(game_result.uuid_1, 0) + 1
+                continue
+            assert game_result.uuid_1 is not None
+            game = frozenset((game_result.uuid_1, game_result.uuid_2))
+            assert game not in games, "Repeated pairing"
+            games.add(game)
+            colours.setdefault(game_result.uuid_1, []).append(1)
+            colours.setdefault(game_result.uuid_2, []).append(-1)
+
+    for sequence in colours.values():
+        assert abs(sum(sequence)) <= 2, "Colour difference above two"
+        assert all(len(set(sequence[i:i + 3])) > 1 for i in range(len(sequence) - 2)), "Same colour three times"
+    assert all(count == 1 for count in byes.values()), "Second bye"
+
+
+def play_round(tournament: SwissTournament) -> None:
+    """Add random results for the current pairings."""
+    pairings = tournament.get_pairings()
+    assert pairings is not None
+    assert Pairings.is_finalized(pairings)
+    round_result = RoundResult.from_pairings(pairings)
+    for game_result in round_result.items:
+        assign_random_game_result(game_result)
+    tournament.add_round_result(round_result)
+
+
+# Play a few seeded tournaments with an odd number of players and check every round
+for seed in range(5):
+    random.seed(seed)
+    players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2800)) for i in range(41)]
+    tournament = SwissTournament(participants=players, parameters=SwissParameters(rounds=7))
+    while not tournament.is_finished():
+        tournament.generate_pairings()
+        play_round(tournament)
+        check_round(tournament)
+    print(f"Seed {seed}: {len(tournament.states.results)} rounds without repeats, colour or bye violations")
+
+# Withdraw players after the pairings were published and check that the remaining boards are kept
+random.seed(0)
+players = [Player(name=f"Player {i + 1}", rating=random.randint(1000, 2800)) for i in range(40)]
+tournament = SwissTournament(participants=players, parameters=SwissParameters(rounds=7))
+for _ in range(4):
+    tournament.generate_pairings()
+    play_round(tournament)
+tournament.generate_pairings()
+published = tournament.get_pairings()
+assert published is not None
+tournament.drop_out(random.sample(tournament.participants, 3))
+tournament.update_pairings()
+updated = tournament.get_pairings()
+assert updated is not None
+
+dropped = tournament.states.drop_outs
+kept = [
+    item for item in published.items
+    if item.uuid_1.content not in dropped and item.uuid_2.content not in dropped and item.uuid_2.content is not None
+]
+assert all(item in updated.items for item in kept), "A kept board was changed"
+byes = [item.uuid_1.content for item in updated.items if item.uuid_2.content is None]
+assert len(byes) == 1
+play_round(tournament)
+check_round(tournament)
+bye_result = tournament.states.results.rounds[-1].items[-1]
+assert bye_result.result_1 == IndividualResult.PAIRING_ALLOCATED_BYE
+print(f"Re-paired after withdrawals: {len(kept)} boards kept, one bye")
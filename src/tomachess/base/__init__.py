@@ -1,6 +1,6 @@
 from tomachess.base.parameters_base import AbstractParameters, ParametersBase, TeamParametersBase
 from tomachess.base.states_base import AbstractStates, StatesBase, TeamStatesBase
-from tomachess.base.tournament_base import AbstractTournamentBase, TeamTournamentBase, TournamentBase
+from tomachess.base.tournament_base import AbstractTournamentBase, TeamTournamentBase, TournamentBase, versioned_write
 
 __all__ = [
     "AbstractParameters",
@@ -12,4 +12,5 @@ __all__ = [
     "TeamStatesBase",
     "TeamTournamentBase",
     "TournamentBase",
+    "versioned_write",
 ]
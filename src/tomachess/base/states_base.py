@@ -1,18 +1,36 @@
 from abc import ABC
+from typing import Any, Self
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from tomachess.classes import TrackedSet
+from tomachess.models import Trusted
 from tomachess.state import Pairings, Results, TeamParings, TeamResults
 
 
 class AbstractStates(BaseModel, ABC):
     type: str
-    drop_outs: set[UUID] = set()
-    byes: set[UUID] = set()
+    drop_outs: TrackedSet[UUID] = TrackedSet()
+    byes: TrackedSet[UUID] = TrackedSet()
     pairings: Pairings | None = None
     results: Results = Results()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("drop_outs", "byes") and not isinstance(value, TrackedSet):
+            value = TrackedSet(value)
+        super().__setattr__(name, value)
+
+    def get_snapshot(self) -> Self:
+        data: dict[str, Any] = {}
+        for name, value in self:
+            if isinstance(value, (Results, TeamResults)):
+                value = value.get_snapshot()
+            elif isinstance(value, (list, set)):
+                value = type(value)(value)
+            data[name] = value
+        return Trusted.construct(type(self), **data)
+
 
 class StatesBase(AbstractStates, ABC):
     type: str
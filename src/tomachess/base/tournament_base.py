@@ -1,16 +1,46 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Sequence, TypeVar
+from functools import wraps
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Concatenate,
+    Generic,
+    Iterator,
+    Mapping,
+    ParamSpec,
+    Self,
+    Sequence,
+    TypeVar
+)
 from uuid import UUID
 
+from pydantic import PrivateAttr
+
 from tomachess.base.parameters_base import ParametersBase, TeamParametersBase
 from tomachess.base.states_base import StatesBase, TeamStatesBase
-from tomachess.classes import DefaultStandingsCalculator, PairingEngine, StandingsCalculator
+from tomachess.classes import (
+    IncrementalStandingsCalculator,
+    PairingBudget,
+    PairingEngine,
+    PairingSearchResult,
+    PairingStateIndex,
+    ParticipantIndex,
+    StandingsAccumulator,
+    StandingsCalculator,
+    TrackedList,
+    TrackedSet,
+    Versioning
+)
 from tomachess.exceptions import NotFoundError, PairingError, ResultError, TournamentPermissionError
-from tomachess.models import Entity, Standings
+from tomachess.models import CompactStandings, Entity, Standings, Trusted
 from tomachess.participant import Participant, Player, Team
-from tomachess.state import Pairings, TeamParings
+from tomachess.state import Pairings, TeamParings, TeamResults
 from tomachess.state.results.round_result import RoundResult
 from tomachess.state.team_pairings import TeamPairing
 from tomachess.state.team_results import TeamGameResult, TeamRoundResult
@@ -19,47 +49,181 @@ if TYPE_CHECKING:
     from tomachess.union_type import Parameters, States
 
 T = TypeVar("T", bound=Participant)
+B = TypeVar("B", bound="AbstractTournamentBase[Any]")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def versioned_write(method: Callable[Concatenate[B, P], R]) -> Callable[Concatenate[B, P], R]:
+    @wraps(method)
+    def wrapper(tournament: B, *args: P.args, **kwargs: P.kwargs) -> R:
+        with tournament._versioning.write():
+            return method(tournament, *args, **kwargs)
+    return wrapper
 
 
 class AbstractTournamentBase(Entity, Generic[T], ABC):
     pairing_engine: ClassVar[PairingEngine[Any]]
-    standings_calculator: ClassVar[StandingsCalculator[Any]] = DefaultStandingsCalculator()
+    standings_calculator: ClassVar[StandingsCalculator[Any]] = IncrementalStandingsCalculator()
 
     type: str
-    participants: list[T] = []
+    participants: TrackedList[T] = TrackedList()
     parameters: Parameters
     states: States
 
-    def get_participant_uuids(self) -> set[UUID]:
-        return {participant.uuid for participant in self.participants}
-
-    def get_participant_dict(self) -> dict[UUID, T]:
-        return {participant.uuid: participant for participant in self.participants}
+    _standings_accumulator: StandingsAccumulator | None = PrivateAttr(default=None)
+    _pairing_state_index: PairingStateIndex | None = PrivateAttr(default=None)
+    _participant_index: ParticipantIndex[T] | None = PrivateAttr(default=None)
+    _versioning: Versioning[Any] = PrivateAttr(default_factory=Versioning)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "participants" and not isinstance(value, TrackedList):
+            value = TrackedList(value)
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.participants = copied.participants
+        for name, private_attribute in type(self).__private_attributes__.items():
+            setattr(copied, name, private_attribute.get_default())
+        copied._versioning = Versioning(self._versioning.version)
+        return copied
+
+    def get_version(self) -> int:
+        return self._versioning.version
+
+    def _create_snapshot(self) -> Self:
+        data = dict(self)
+        data["participants"] = TrackedList(self.participants)
+        data["parameters"] = self.parameters.model_copy()
+        data["states"] = self.states.get_snapshot()
+        snapshot = Trusted.construct(type(self), **data)
+        snapshot._versioning = Versioning(self._versioning.version, read_only=True)
+        return snapshot
+
+    def get_snapshot(self) -> Self:
+        return self._versioning.get_snapshot(self._create_snapshot)
+
+    def _get_participant_revision(self) -> tuple[int, int, int]:
+        return self.participants.revision, self.states.drop_outs.revision, self.states.byes.revision
+
+    def _stamp_participant_index(self, participant_index: ParticipantIndex[T]) -> None:
+        participant_index.revision = self._get_participant_revision()
+
+    def get_participant_index(self) -> ParticipantIndex[T]:
+        participant_index = self._participant_index
+        if participant_index is None or participant_index.revision != self._get_participant_revision():
+            participant_index = ParticipantIndex.from_participants(
+                self.participants,
+                self.states.drop_outs,
+                self.states.byes,
+                self.states.results.rounds.columns.keys
+            )
+            self._stamp_participant_index(participant_index)
+            self._participant_index = participant_index
+        return participant_index
+
+    def get_participant_uuids(self) -> AbstractSet[UUID]:
+        return self.get_participant_index().participant_dict.keys()
+
+    def get_participant_dict(self) -> Mapping[UUID, T]:
+        return MappingProxyType(self.get_participant_index().participant_dict)
 
     def get_pairings(self) -> Pairings | None:
         if self.states.pairings is None:
             return None
-        return self.states.pairings.model_copy(deep=True)
+        return self.states.pairings
+
+    def _get_team_results(self) -> TeamResults | None:
+        return None
+
+    def build_standings_accumulator(self, rounds: int | None = None) -> StandingsAccumulator:
+        return StandingsAccumulator.from_results(self.states.results, self._get_team_results(), rounds)
+
+    def iterate_standings_accumulators(self) -> Iterator[StandingsAccumulator]:
+        return StandingsAccumulator.iterate_results(self.states.results, self._get_team_results())
+
+    def get_standings_accumulator(self) -> StandingsAccumulator:
+        accumulator = self._standings_accumulator
+        if accumulator is None or not accumulator.is_synchronized(self.states.results):
+            accumulator = self.build_standings_accumulator()
+            self._standings_accumulator = accumulator
+        return accumulator
+
+    def get_pairing_state_index(self) -> PairingStateIndex:
+        pairing_state_index = self._pairing_state_index
+        scoring_system = self.parameters.scoring_system
+        if pairing_state_index is None or not pairing_state_index.is_synchronized(self.states.results, scoring_system):
+            keys = self.get_participant_index().keys
+            pairing_state_index = PairingStateIndex.from_results(self.states.results, scoring_system, keys)
+            self._pairing_state_index = pairing_state_index
+        return pairing_state_index
 
     def get_standings(self) -> Standings:
         return self.standings_calculator.get_standings(self)
 
-    def generate_pairings(self) -> None:
+    def get_compact_standings(self) -> CompactStandings:
+        return self.standings_calculator.get_compact_standings(self)
+
+    def get_round_standings(self, rounds: int) -> Standings:
+        if not 0 <= rounds <= len(self.states.results):
+            raise NotFoundError(f"There are no standings after {rounds} rounds")
+        return self.standings_calculator.get_round_standings(self, rounds)
+
+    def get_standings_history(self) -> list[Standings]:
+        return self.standings_calculator.get_standings_history(self)
+
+    def get_top_standings(self, k: int) -> Standings:
+        return self.standings_calculator.get_top_standings(self, k)
+
+    def get_standings_page(self, page: int, page_size: int) -> Standings:
+        return self.standings_calculator.get_standings_page(self, page, page_size)
+
+    def get_rank(self, uuid: UUID) -> int:
+        return self.standings_calculator.get_rank(self, uuid)
+
+    @versioned_write
+    def generate_pairings(
+            self,
+            budget: PairingBudget | None = None,
+            search_result: PairingSearchResult | None = None
+    ) -> PairingSearchResult:
         if self.states.pairings is not None:
             raise PairingError("Pairings were already generated")
         if self.is_finished():
             raise PairingError("The tournament is already finished")
-        self.states.pairings = self.pairing_engine.get_pairings(self)
+        search_result = self._search_pairings(budget, search_result)
+        self.states.pairings = search_result.pairings
+        return search_result
+
+    def _search_pairings(
+            self,
+            budget: PairingBudget | None,
+            search_result: PairingSearchResult | None
+    ) -> PairingSearchResult:
+        if search_result is None:
+            return self.pairing_engine.search_pairings(self, budget)
+        if not Pairings.is_valid(search_result.pairings):
+            raise PairingError("The provided pairings are invalid")
+        return search_result
+
+    @versioned_write
+    def update_pairings(self) -> None:
+        if self.states.pairings is None:
+            raise PairingError("No pairings were generated")
+        self.states.pairings = self.pairing_engine.update_pairings(self, self.states.pairings)
 
+    @versioned_write
     def clarify_pairings(self, pairings: Pairings) -> None:
         if self.states.pairings is None:
             raise PairingError("No pairings were generated")
-        if not Pairings.is_valid(pairings):
-            raise PairingError("The provided pairings are invalid")
-        if not pairings.is_stricter_than(self.states.pairings):
-            raise PairingError("The provided pairings are looser than the current ones")
+        violations = pairings.get_violations(self.states.pairings)
+        if violations:
+            message = "; ".join(map(str, violations))
+            raise PairingError(f"The provided pairings are invalid: {message}")
         self.states.pairings = pairings
 
+    @versioned_write
     def finalize_pairings(self, pairings: Pairings) -> None:
         if not Pairings.is_finalized(pairings):
             raise PairingError("The provided pairings are not final")
@@ -78,53 +242,87 @@ class AbstractTournamentBase(Entity, Generic[T], ABC):
     def is_taking_byes_allowed(self) -> bool:
         return False
 
+    @versioned_write
     def drop_out(self, participants: Sequence[T]) -> None:
         if not self.is_drop_out_allowed():
             raise TournamentPermissionError("Dropping out is not allowed")
+        participant_index = self.get_participant_index()
         uuids = set(participant.uuid for participant in participants)
-        if not uuids.issubset(self.get_participant_uuids()):
+        if not all(uuid in participant_index for uuid in uuids):
             raise NotFoundError("Some participants are not present")
         result_uuids = self.states.results.get_uuids()
         remove_uuids = uuids - result_uuids
-        self.participants = [participant for participant in self.participants if participant.uuid not in remove_uuids]
+        self.participants = TrackedList(
+            participant for participant in self.participants if participant.uuid not in remove_uuids
+        )
         self.states.drop_outs |= (uuids - remove_uuids)
+        self.states.byes -= remove_uuids
+        for uuid in remove_uuids:
+            participant_index.remove(uuid)
+        participant_index.set_dropped_out(uuids - remove_uuids, True)
+        self._stamp_participant_index(participant_index)
 
+    @versioned_write
     def drop_in(self, participants: Sequence[T]) -> None:
         if not self.is_drop_in_allowed():
             raise TournamentPermissionError("Dropping in is not allowed")
-        uuids = self.get_participant_uuids()
+        participant_index = self.get_participant_index()
         for participant in participants:
             self.states.drop_outs.discard(participant.uuid)
-            if participant.uuid not in uuids:
+            if participant.uuid not in participant_index:
                 self.participants.append(participant)
-                uuids.add(participant.uuid)
-
+                participant_index.add(participant)
+        participant_index.set_dropped_out([participant.uuid for participant in participants], False)
+        self._stamp_participant_index(participant_index)
+
+    @versioned_write
+    def bind_participants(self, participants: Mapping[UUID, T]) -> None:
+        participant_index = self.get_participant_index()
+        self.participants = TrackedList(participants[participant.uuid] for participant in self.participants)
+        for participant in self.participants:
+            participant_index.replace(participant)
+        self._stamp_participant_index(participant_index)
+
+    @versioned_write
     def take_byes(self, participants: Sequence[T]) -> None:
         if not self.is_taking_byes_allowed():
             raise TournamentPermissionError("Taking byes is not allowed")
+        participant_index = self.get_participant_index()
         uuids = set(participant.uuid for participant in participants)
-        if not uuids.issubset(self.get_participant_uuids()):
+        if not all(uuid in participant_index for uuid in uuids):
             raise NotFoundError("Some participants are not present")
-        self.states.byes |= set(uuids)
+        self.states.byes |= uuids
+        participant_index.set_byes(uuids, True)
+        self._stamp_participant_index(participant_index)
 
 
 class TournamentBase(AbstractTournamentBase[Player]):
     parameters: ParametersBase
     states: StatesBase
 
+    @versioned_write
     def add_round_result(self, round_result: RoundResult) -> None:
         pairings = round_result.get_pairings()
         if self.states.pairings is None:
             raise PairingError("No pairings were generated")
-        if not pairings.is_stricter_than(self.states.pairings):
-            raise PairingError("The provided round result does not match the pairings")
+        violations = pairings.get_violations(self.states.pairings)
+        if violations:
+            message = "; ".join(map(str, violations))
+            raise PairingError(f"The provided round result does not match the pairings: {message}")
         if not RoundResult.is_valid(round_result):
             raise ResultError("Some game results are invalid")
         if not RoundResult.is_finalized(round_result):
             raise ResultError("Some game results are missing")
-        self.states.results.rounds.append(round_result)
+        accumulator = self.get_standings_accumulator()
+        pairing_state_index = self.get_pairing_state_index()
+        participant_index = self.get_participant_index()
+        self.states.results.add_round_result(round_result)
+        accumulator.add_round_result(round_result)
+        pairing_state_index.add_round_result(round_result)
         self.states.pairings = None
-        self.states.byes = set()
+        self.states.byes = TrackedSet()
+        participant_index.clear_byes()
+        self._stamp_participant_index(participant_index)
 
     def is_finished(self) -> bool:
         return False
@@ -138,25 +336,52 @@ class TeamTournamentBase(AbstractTournamentBase[Team]):
         assert self.states.pairings is not None
         if Pairings.is_finalized(self.states.pairings):
             self.states.team_pairings = TeamParings.from_pairings(self.states.pairings, self.parameters.boards)
-            self.states.team_results.rounds.append(TeamRoundResult.get_empty_instance(self.states.team_pairings))
+            self.states.team_results.add_round(TeamRoundResult.get_empty_instance(self.states.team_pairings))
+
+    def _get_team_results(self) -> TeamResults | None:
+        return self.states.team_results
 
     def get_team_pairings(self) -> TeamParings | None:
         if self.states.team_pairings is None:
             return None
-        return self.states.team_pairings.model_copy(deep=True)
-
-    def generate_pairings(self) -> None:
-        super().generate_pairings()
+        return self.states.team_pairings
+
+    @versioned_write
+    def generate_pairings(
+            self,
+            budget: PairingBudget | None = None,
+            search_result: PairingSearchResult | None = None
+    ) -> PairingSearchResult:
+        search_result = super().generate_pairings(budget, search_result)
+        self._initialize_team_pairings_and_results()
+        return search_result
+
+    @versioned_write
+    def update_pairings(self) -> None:
+        team_pairings = self.states.team_pairings
+        if team_pairings is not None:
+            if any(not TeamGameResult.is_empty(item) for item in self.states.team_results.rounds[-1].items):
+                raise PairingError("Some team game results were already added")
+            self.states.team_results.pop_round()
+            self.states.team_pairings = None
+        super().update_pairings()
         self._initialize_team_pairings_and_results()
+        if team_pairings is not None and self.states.team_pairings is not None:
+            previous = {(item.team_1, item.team_2): item for item in team_pairings.items}
+            items = tuple(previous.get((item.team_1, item.team_2), item) for item in self.states.team_pairings.items)
+            self.states.team_pairings = self.states.team_pairings.model_copy(update={"items": items})
 
+    @versioned_write
     def clarify_pairings(self, pairings: Pairings) -> None:
         super().clarify_pairings(pairings)
         self._initialize_team_pairings_and_results()
 
+    @versioned_write
     def finalize_pairings(self, pairings: Pairings) -> None:
         super().finalize_pairings(pairings)
         self._initialize_team_pairings_and_results()
 
+    @versioned_write
     def clarify_team_pairing(self, index: int, team_pairing: TeamPairing) -> None:
         if self.states.team_pairings is None:
             raise PairingError("No team pairings were generated")
@@ -164,13 +389,15 @@ class TeamTournamentBase(AbstractTournamentBase[Team]):
             raise PairingError("The provided team pairing is invalid")
         if not team_pairing.is_stricter_than(self.states.team_pairings.items[index]):
             raise PairingError("The provided pairing is looser than the current one")
-        self.states.team_pairings.items[index] = team_pairing
+        self.states.team_pairings = self.states.team_pairings.with_item(index, team_pairing)
 
+    @versioned_write
     def finalize_team_pairing(self, index: int, team_pairing: TeamPairing) -> None:
         if not TeamPairing.is_finalized(team_pairing):
             raise PairingError("The provided pairings are not final")
         self.clarify_team_pairing(index, team_pairing)
 
+    @versioned_write
     def add_team_game_result(self, index: int, team_game_result: TeamGameResult) -> None:
         team_pairing = team_game_result.get_team_pairing()
         if self.states.team_pairings is None:
@@ -181,14 +408,22 @@ class TeamTournamentBase(AbstractTournamentBase[Team]):
             raise ResultError("Some game results are invalid")
         if not TeamGameResult.is_finalized(team_game_result):
             raise ResultError("Some game results are missing")
+        accumulator = self.get_standings_accumulator()
+        self.states.team_results.set_team_game_result(index, team_game_result)
         current_team_round_result = self.states.team_results.rounds[-1]
-        current_team_round_result.items[index] = team_game_result
+        accumulator.set_team_game_result((len(self.states.team_results) - 1, index), team_game_result)
         if not TeamRoundResult.has_empty(current_team_round_result):
             round_result = current_team_round_result.get_round_result(self.parameters.board_scoring_system)
-            self.states.results.rounds.append(round_result)
+            pairing_state_index = self.get_pairing_state_index()
+            participant_index = self.get_participant_index()
+            self.states.results.add_round_result(round_result)
+            accumulator.add_round_result(round_result)
+            pairing_state_index.add_round_result(round_result)
             self.states.pairings = None
             self.states.team_pairings = None
-            self.states.byes = set()
+            self.states.byes = TrackedSet()
+            participant_index.clear_byes()
+            self._stamp_participant_index(participant_index)
 
     def is_finished(self) -> bool:
         return False
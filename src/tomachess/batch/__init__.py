@@ -0,0 +1,4 @@
+from tomachess.batch.event import Event
+from tomachess.batch.standings_batch import StandingsBatch
+
+__all__ = ["Event", "StandingsBatch"]
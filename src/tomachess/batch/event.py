@@ -0,0 +1,98 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Self
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from tomachess.batch.standings_batch import StandingsBatch
+from tomachess.classes import PairingBudget, PairingSearchResult
+from tomachess.exceptions import NotFoundError
+from tomachess.models import Standings
+from tomachess.participant import Player
+from tomachess.state import Pairings
+from tomachess.store import AbstractStore
+from tomachess.union_type import Tournament
+
+PairingPayload = tuple[str, PairingBudget | None]
+PairingRows = tuple[str, float, bool, int]
+
+_TOURNAMENT_ADAPTER: TypeAdapter[Tournament] = TypeAdapter(Tournament)
+
+
+def _generate_pairings(payload: PairingPayload) -> PairingRows:
+    data, budget = payload
+    tournament = _TOURNAMENT_ADAPTER.validate_json(data)
+    search_result = tournament.generate_pairings(budget)
+    pairings = search_result.pairings.model_dump_json()
+    return pairings, search_result.penalty, search_result.optimal, search_result.iterations
+
+
+class Event:
+    def __init__(
+            self,
+            players: Iterable[Player] = (),
+            sections: Iterable[Tournament] = (),
+            max_workers: int | None = None
+    ) -> None:
+        self.players: dict[UUID, Player] = {}
+        self.sections: list[Tournament] = []
+        self.max_workers: int | None = max_workers
+        self.add_players(players)
+        for section in sections:
+            self.add_section(section)
+
+    def add_players(self, players: Iterable[Player]) -> None:
+        for player in players:
+            self.players.setdefault(player.uuid, player)
+
+    def add_section(self, section: Tournament) -> None:
+        if any(participant.uuid not in self.players for participant in section.participants):
+            raise NotFoundError("Some participants are not in the player pool")
+        section.bind_participants(self.players)
+        self.sections.append(section)
+
+    def get_section(self, uuid: UUID) -> Tournament:
+        section = next((section for section in self.sections if section.uuid == uuid), None)
+        if section is None:
+            raise NotFoundError("The section is not present")
+        return section
+
+    def get_pairings(self) -> dict[UUID, Pairings | None]:
+        return {section.uuid: section.get_pairings() for section in self.sections}
+
+    def generate_pairings(self, budget: PairingBudget | None = None) -> dict[UUID, PairingSearchResult]:
+        positions = [
+            position for position, section in enumerate(self.sections)
+            if section.states.pairings is None and not section.is_finished()
+        ]
+        if self.max_workers == 1 or len(positions) <= 1:
+            results = {}
+            for position in positions:
+                section = self.sections[position]
+                results[section.uuid] = section.generate_pairings(budget)
+            return results
+
+        payloads = [(self.sections[position].model_dump_json(), budget) for position in positions]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            rows = list(executor.map(_generate_pairings, payloads))
+        results = {}
+        for position, (data, penalty, optimal, iterations) in zip(positions, rows):
+            section = self.sections[position]
+            search_result = PairingSearchResult(Pairings.model_validate_json(data), penalty, optimal, iterations)
+            results[section.uuid] = section.generate_pairings(budget, search_result)
+        return results
+
+    def get_standings(self) -> dict[UUID, Standings]:
+        standings = StandingsBatch(max_workers=self.max_workers, chunk_size=1).get_standings(self.sections)
+        return {section.uuid: item for section, item in zip(self.sections, standings)}
+
+    def save(self, store: AbstractStore, collection: str) -> None:
+        store.save_players(collection, list(self.players.values()))
+        store.save_tournaments(collection, self.sections)
+
+    @classmethod
+    def load(cls, store: AbstractStore, collection: str, max_workers: int | None = None) -> Self:
+        return cls(store.load_players(collection), store.load_tournaments(collection), max_workers)
+
+    def is_finished(self) -> bool:
+        return all(section.is_finished() for section in self.sections)
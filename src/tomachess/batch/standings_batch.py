@@ -0,0 +1,75 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Sequence
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from tomachess.base import TeamTournamentBase
+from tomachess.models import CompactStandings, Standings
+from tomachess.store import AbstractStore
+from tomachess.union_type import TeamTournament, Tournament
+
+Payload = tuple[bool, str]
+StandingsRows = list[tuple[UUID, tuple[float, ...], int | None]]
+
+_TOURNAMENT_ADAPTER: TypeAdapter[Tournament] = TypeAdapter(Tournament)
+_TEAM_TOURNAMENT_ADAPTER: TypeAdapter[TeamTournament] = TypeAdapter(TeamTournament)
+
+
+def _compute_chunk(payloads: list[Payload]) -> list[StandingsRows]:
+    chunk_rows = []
+    for team, payload in payloads:
+        tournament: Tournament | TeamTournament
+        if team:
+            tournament = _TEAM_TOURNAMENT_ADAPTER.validate_json(payload)
+        else:
+            tournament = _TOURNAMENT_ADAPTER.validate_json(payload)
+        compact_standings = tournament.get_compact_standings()
+        chunk_rows.append([(item.uuid, item.scores, item.rank) for item in compact_standings.items])
+    return chunk_rows
+
+
+class StandingsBatch:
+    def __init__(self, max_workers: int | None = None, chunk_size: int = 8) -> None:
+        self.max_workers: int | None = max_workers
+        self.chunk_size: int = chunk_size
+
+    @staticmethod
+    def _to_payload(tournament: Tournament | TeamTournament) -> Payload:
+        if not isinstance(tournament, TeamTournamentBase):
+            return False, tournament.model_dump_json()
+        data: dict[str, Any] = tournament.model_dump(mode="json", exclude={"participants": {"__all__": {"members"}}})
+        for team in data["participants"]:
+            team["members"] = []
+        return True, json.dumps(data)
+
+    @staticmethod
+    def _from_rows(tournament: Tournament | TeamTournament, rows: StandingsRows) -> Standings:
+        order = [uuid for uuid, _, _ in rows]
+        scores = {uuid: scores for uuid, scores, _ in rows}
+        ranks = [rank for _, _, rank in rows]
+        participant_dict = tournament.get_participant_dict()
+        return CompactStandings.from_scores(order, scores, ranks, participant_dict).to_standings()
+
+    def _get_chunks(self, payloads: list[Payload]) -> list[list[Payload]]:
+        return [payloads[i:i + self.chunk_size] for i in range(0, len(payloads), self.chunk_size)]
+
+    def _compute_rows(self, payloads: list[Payload]) -> list[StandingsRows]:
+        chunks = self._get_chunks(payloads)
+        if self.max_workers == 1 or len(chunks) <= 1:
+            return [rows for chunk in chunks for rows in _compute_chunk(chunk)]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return [rows for chunk_rows in executor.map(_compute_chunk, chunks) for rows in chunk_rows]
+
+    def get_standings(self, tournaments: Sequence[Tournament | TeamTournament]) -> list[Standings]:
+        payloads = [self._to_payload(tournament) for tournament in tournaments]
+        rows = self._compute_rows(payloads)
+        return [self._from_rows(tournament, tournament_rows) for tournament, tournament_rows in zip(tournaments, rows)]
+
+    def get_collection_standings(self, store: AbstractStore, collection: str) -> dict[UUID, Standings]:
+        tournaments: list[Tournament | TeamTournament] = []
+        tournaments.extend(store.load_tournaments(collection))
+        tournaments.extend(store.load_team_tournaments(collection))
+        standings = self.get_standings(tournaments)
+        return {tournament.uuid: item for tournament, item in zip(tournaments, standings)}
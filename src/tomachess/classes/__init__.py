@@ -1,4 +1,31 @@
+from tomachess.classes.pairing_budget import PairingBudget, PairingSearchResult
 from tomachess.classes.pairing_engine import PairingEngine
-from tomachess.classes.standings_calculator import DefaultStandingsCalculator, StandingsCalculator
+from tomachess.classes.pairing_state_index import PairingStateIndex
+from tomachess.classes.participant_index import ParticipantIndex
+from tomachess.classes.standings_accumulator import StandingsAccumulator
+from tomachess.classes.standings_calculator import (
+    DefaultStandingsCalculator,
+    IncrementalStandingsCalculator,
+    LazyStandingsCalculator,
+    StandingsCalculator
+)
+from tomachess.classes.standings_context import StandingsContext
+from tomachess.classes.tracked_collections import TrackedList, TrackedSet
+from tomachess.classes.versioning import Versioning
 
-__all__ = ["DefaultStandingsCalculator", "PairingEngine", "StandingsCalculator"]
+__all__ = [
+    "DefaultStandingsCalculator",
+    "IncrementalStandingsCalculator",
+    "LazyStandingsCalculator",
+    "PairingBudget",
+    "PairingEngine",
+    "PairingSearchResult",
+    "PairingStateIndex",
+    "ParticipantIndex",
+    "StandingsAccumulator",
+    "StandingsCalculator",
+    "StandingsContext",
+    "TrackedList",
+    "TrackedSet",
+    "Versioning"
+]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import NamedTuple
+
+from tomachess.state import Pairings
+
+
+class PairingBudget:
+    def __init__(self, seconds: float | None = None, iterations: int | None = None) -> None:
+        self.seconds = seconds
+        self.iterations = iterations
+        self.started: float | None = None
+        self.spent: int = 0
+
+    def start(self) -> None:
+        self.started = perf_counter()
+        self.spent = 0
+
+    def get_elapsed(self) -> float:
+        return 0.0 if self.started is None else perf_counter() - self.started
+
+    def is_exhausted(self) -> bool:
+        if self.iterations is not None and self.spent >= self.iterations:
+            return True
+        return self.seconds is not None and self.get_elapsed() >= self.seconds
+
+    def consume(self, iterations: int = 1) -> bool:
+        self.spent += iterations
+        return not self.is_exhausted()
+
+
+class PairingSearchResult(NamedTuple):
+    pairings: Pairings
+    penalty: float = 0.0
+    optimal: bool = True
+    iterations: int = 0
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from tomachess.classes.pairing_budget import PairingBudget, PairingSearchResult
 from tomachess.state import Pairings
 
 if TYPE_CHECKING:
@@ -14,5 +15,13 @@ T = TypeVar("T", bound="AbstractTournamentBase[Any]")
 class PairingEngine(Generic[T], ABC):
     @classmethod
     @abstractmethod
-    def get_pairings(cls, tournament: T) -> Pairings:
+    def get_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> Pairings:
         pass
+
+    @classmethod
+    def search_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> PairingSearchResult:
+        return PairingSearchResult(pairings=cls.get_pairings(tournament, budget))
+
+    @classmethod
+    def update_pairings(cls, tournament: T, pairings: Pairings) -> Pairings:
+        return cls.get_pairings(tournament)
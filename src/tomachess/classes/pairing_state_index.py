@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Self
+from uuid import UUID
+
+from tomachess.state import Results
+from tomachess.state.results import FinalizedRoundResult, IndividualResult, KeySpace
+
+if TYPE_CHECKING:
+    from tomachess.parameter import ScoringSystem
+
+WHITE = 1
+BLACK = -1
+UPFLOAT = 1
+DOWNFLOAT = -1
+
+_BYE_RESULTS = frozenset({IndividualResult.PAIRING_ALLOCATED_BYE, IndividualResult.FORFEIT_WIN})
+
+
+class PairingStateIndex:
+    def __init__(self, scoring_system: ScoringSystem, keys: KeySpace | None = None) -> None:
+        self.scoring_system = scoring_system.model_copy()
+        self.keys = KeySpace() if keys is None else keys
+        self.rounds: int = 0
+        self.scores: array[float] = array("d")
+        self.byes: array[int] = array("H")
+        self.colours: list[array[int]] = []
+        self.floats: list[array[int]] = []
+        self.opponents: list[set[UUID]] = []
+
+    @classmethod
+    def from_results(cls, results: Results, scoring_system: ScoringSystem, keys: KeySpace | None = None) -> Self:
+        pairing_state_index = cls(scoring_system, keys)
+        for round_result in results.rounds:
+            pairing_state_index.add_round_result(round_result)
+        return pairing_state_index
+
+    def _find_position(self, uuid: UUID) -> int | None:
+        position = self.keys.find(uuid)
+        return position if position is not None and position < len(self.scores) else None
+
+    def _get_position(self, uuid: UUID) -> int:
+        position = self.keys.add(uuid)
+        while len(self.scores) <= position:
+            self.scores.append(0.0)
+            self.byes.append(0)
+            self.colours.append(array("b"))
+            self.floats.append(array("b"))
+            self.opponents.append(set())
+        return position
+
+    def _add_game(self, uuid: UUID, uuid_opp: UUID | None, result: IndividualResult, colour: int, floated: int) -> None:
+        position = self._get_position(uuid)
+        if uuid_opp is not None and not result.unplayed:
+            self.colours[position].append(colour)
+            self.opponents[position].add(uuid_opp)
+        if result in _BYE_RESULTS:
+            self.byes[position] += 1
+        self.floats[position].append(floated)
+
+    @staticmethod
+    def _get_float(score: float, score_opp: float) -> int:
+        if score < score_opp:
+            return UPFLOAT
+        if score > score_opp:
+            return DOWNFLOAT
+        return 0
+
+    def is_synchronized(self, results: Results, scoring_system: ScoringSystem) -> bool:
+        return self.rounds == len(results) and self.scoring_system == scoring_system
+
+    def add_round_result(self, round_result: FinalizedRoundResult) -> None:
+        points = self.scoring_system.get_compiled().points
+        for game in round_result.items:
+            score_1, score_2 = self.get_score(game.uuid_1), self.get_score(game.uuid_2)
+            played = game.uuid_1 is not None and game.uuid_2 is not None
+            if game.uuid_1 is not None:
+                floated = self._get_float(score_1, score_2) if played else 0
+                self._add_game(game.uuid_1, game.uuid_2, game.result_1, WHITE, floated)
+            if game.uuid_2 is not None:
+                floated = self._get_float(score_2, score_1) if played else 0
+                self._add_game(game.uuid_2, game.uuid_1, game.result_2, BLACK, floated)
+        for game in round_result.items:
+            if game.uuid_1 is not None:
+                self.scores[self.keys.positions[game.uuid_1]] += points[game.result_1]
+            if game.uuid_2 is not None:
+                self.scores[self.keys.positions[game.uuid_2]] += points[game.result_2]
+        self.rounds += 1
+
+    def get_score(self, uuid: UUID | None) -> float:
+        position = self._find_position(uuid) if uuid is not None else None
+        return 0.0 if position is None else self.scores[position]
+
+    def get_bye_count(self, uuid: UUID) -> int:
+        position = self._find_position(uuid)
+        return 0 if position is None else self.byes[position]
+
+    def get_colours(self, uuid: UUID) -> array[int]:
+        position = self._find_position(uuid)
+        return array("b") if position is None else self.colours[position]
+
+    def get_floats(self, uuid: UUID) -> array[int]:
+        position = self._find_position(uuid)
+        return array("b") if position is None else self.floats[position]
+
+    def get_opponents(self, uuid: UUID) -> set[UUID]:
+        position = self._find_position(uuid)
+        return set() if position is None else self.opponents[position]
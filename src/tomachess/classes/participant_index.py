@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Self, Sequence, TypeVar
+from uuid import UUID
+
+from tomachess.exceptions import NotFoundError
+from tomachess.participant import Participant
+from tomachess.state.results import KeySpace
+
+T = TypeVar("T", bound=Participant)
+
+
+class ParticipantIndex(Generic[T]):
+    def __init__(self, participants: Sequence[T] = (), keys: KeySpace | None = None) -> None:
+        self.keys = KeySpace() if keys is None else keys
+        self.participant_dict: dict[UUID, T] = {}
+        self.present: int = 0
+        self.dropped_out: int = 0
+        self.byes: int = 0
+        self.revision: tuple[int, ...] = ()
+        for participant in participants:
+            self.add(participant)
+
+    @classmethod
+    def from_participants(
+            cls,
+            participants: Sequence[T],
+            drop_outs: Iterable[UUID],
+            byes: Iterable[UUID],
+            keys: KeySpace | None = None
+    ) -> Self:
+        participant_index = cls(participants, keys)
+        participant_index.set_dropped_out(drop_outs, True)
+        participant_index.set_byes(byes, True)
+        return participant_index
+
+    def __len__(self) -> int:
+        return len(self.participant_dict)
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self.participant_dict
+
+    def _get_bits(self, uuids: Iterable[UUID]) -> int:
+        bits = 0
+        for uuid in uuids:
+            if uuid in self.participant_dict:
+                bits |= 1 << self.keys.positions[uuid]
+        return bits
+
+    def _find_position(self, uuid: UUID) -> int | None:
+        return self.keys.positions[uuid] if uuid in self.participant_dict else None
+
+    def add(self, participant: T) -> int:
+        position = self.keys.add(participant.uuid)
+        if participant.uuid in self.participant_dict:
+            return position
+        self.participant_dict[participant.uuid] = participant
+        self.present |= 1 << position
+        return position
+
+    def replace(self, participant: T) -> None:
+        if participant.uuid not in self.participant_dict:
+            raise NotFoundError("The participant is not present")
+        self.participant_dict[participant.uuid] = participant
+
+    def remove(self, uuid: UUID) -> None:
+        position = self.get_position(uuid)
+        mask = ~(1 << position)
+        self.present &= mask
+        self.dropped_out &= mask
+        self.byes &= mask
+        del self.participant_dict[uuid]
+
+    def set_dropped_out(self, uuids: Iterable[UUID], dropped_out: bool) -> None:
+        bits = self._get_bits(uuids)
+        self.dropped_out = self.dropped_out | bits if dropped_out else self.dropped_out & ~bits
+
+    def set_byes(self, uuids: Iterable[UUID], bye: bool) -> None:
+        bits = self._get_bits(uuids)
+        self.byes = self.byes | bits if bye else self.byes & ~bits
+
+    def clear_byes(self) -> None:
+        self.byes = 0
+
+    def get_position(self, uuid: UUID) -> int:
+        position = self._find_position(uuid)
+        if position is None:
+            raise NotFoundError("The participant is not present")
+        return position
+
+    def get_uuid(self, position: int) -> UUID:
+        return self.keys.get_uuid(position)
+
+    def get_participant(self, uuid: UUID) -> T:
+        participant = self.participant_dict.get(uuid)
+        if participant is None:
+            raise NotFoundError("The participant is not present")
+        return participant
+
+    def get_active_bits(self) -> int:
+        return self.present & ~self.dropped_out
+
+    def get_pairable_bits(self) -> int:
+        return self.present & ~self.dropped_out & ~self.byes
+
+    def get_participants(self, bits: int) -> list[T]:
+        positions = self.keys.positions
+        return [participant for uuid, participant in self.participant_dict.items() if bits >> positions[uuid] & 1]
+
+    def get_uuids(self, bits: int) -> list[UUID]:
+        positions = self.keys.positions
+        return [uuid for uuid in self.participant_dict if bits >> positions[uuid] & 1]
+
+    def is_active(self, uuid: UUID) -> bool:
+        position = self._find_position(uuid)
+        return position is not None and bool(self.get_active_bits() >> position & 1)
+
+    def is_dropped_out(self, uuid: UUID) -> bool:
+        position = self._find_position(uuid)
+        return position is not None and bool(self.dropped_out >> position & 1)
+
+    def has_bye(self, uuid: UUID) -> bool:
+        position = self._find_position(uuid)
+        return position is not None and bool(self.byes >> position & 1)
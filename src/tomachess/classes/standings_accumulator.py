@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Self
+from uuid import UUID
+
+from tomachess.state import Results, TeamResults
+from tomachess.state.results import FinalizedRoundResult, IndividualResult
+from tomachess.state.team_results import TeamGameResult, TeamRoundResult
+
+if TYPE_CHECKING:
+    from tomachess.parameter import ScoringSystem
+
+GameRecord = tuple[UUID | None, IndividualResult]
+TeamGameKey = tuple[int, int]
+
+
+class StandingsAccumulator:
+    def __init__(self) -> None:
+        self.rounds: int = 0
+        self.games: dict[UUID, list[GameRecord]] = {}
+        self.team_games: dict[UUID, dict[TeamGameKey, tuple[IndividualResult, ...]]] = {}
+        self._scoring_system: ScoringSystem | None = None
+        self._point_scores: dict[UUID, float] = {}
+
+    @classmethod
+    def from_results(
+            cls,
+            results: Results,
+            team_results: TeamResults | None = None,
+            rounds: int | None = None
+    ) -> Self:
+        accumulator = cls()
+        for round_result in results.rounds[:rounds]:
+            accumulator.add_round_result(round_result)
+        if team_results is not None:
+            for round_position, team_round_result in enumerate(team_results.rounds[:rounds]):
+                accumulator.add_team_round_result(round_position, team_round_result)
+        return accumulator
+
+    @classmethod
+    def iterate_results(cls, results: Results, team_results: TeamResults | None = None) -> Iterator[Self]:
+        accumulator = cls()
+        for round_position, round_result in enumerate(results.rounds):
+            accumulator.add_round_result(round_result)
+            if team_results is not None and round_position < len(team_results):
+                accumulator.add_team_round_result(round_position, team_results.rounds[round_position])
+            yield accumulator
+
+    def _add_game(self, uuid: UUID | None, uuid_opp: UUID | None, result: IndividualResult) -> None:
+        if uuid is None:
+            return
+        self.games.setdefault(uuid, []).append((uuid_opp, result))
+        if self._scoring_system is not None:
+            self._point_scores[uuid] = self._point_scores.get(uuid, 0.0) + self._scoring_system.get_points(result)
+
+    def is_synchronized(self, results: Results) -> bool:
+        return self.rounds == len(results)
+
+    def add_round_result(self, round_result: FinalizedRoundResult) -> None:
+        for game in round_result.items:
+            self._add_game(game.uuid_1, game.uuid_2, game.result_1)
+            self._add_game(game.uuid_2, game.uuid_1, game.result_2)
+        self.rounds += 1
+
+    def add_team_round_result(self, round_position: int, team_round_result: TeamRoundResult) -> None:
+        for index, team_game_result in enumerate(team_round_result.items):
+            self.set_team_game_result((round_position, index), team_game_result)
+
+    def set_team_game_result(self, key: TeamGameKey, team_game_result: TeamGameResult) -> None:
+        if TeamGameResult.is_empty(team_game_result) or not TeamGameResult.is_finalized(team_game_result):
+            return
+        if team_game_result.team_1 is not None:
+            results_1 = tuple(item.result_1 for item in team_game_result.items)
+            self.team_games.setdefault(team_game_result.team_1, {})[key] = results_1
+        if team_game_result.team_2 is not None:
+            results_2 = tuple(item.result_2 for item in team_game_result.items)
+            self.team_games.setdefault(team_game_result.team_2, {})[key] = results_2
+
+    def get_point_scores(self, uuids: Iterable[UUID], scoring_system: ScoringSystem) -> dict[UUID, float]:
+        if self._scoring_system != scoring_system:
+            self._scoring_system = scoring_system.model_copy()
+            self._point_scores = {}
+            points = scoring_system.get_compiled().points
+            for uuid, records in self.games.items():
+                score = 0.0
+                for _, result in records:
+                    score += points[result]
+                self._point_scores[uuid] = score
+        return {uuid: self._point_scores.get(uuid, 0.0) for uuid in uuids}
+
+    def get_board_points(self, uuids: Iterable[UUID], board_scoring_system: ScoringSystem) -> dict[UUID, float]:
+        board_point_dict = {}
+        points = board_scoring_system.get_compiled().points
+        for uuid in uuids:
+            team_games = self.team_games.get(uuid, {})
+            score = 0.0
+            for key in sorted(team_games):
+                score += sum(points[result] for result in team_games[key])
+            board_point_dict[uuid] = score
+        return board_point_dict
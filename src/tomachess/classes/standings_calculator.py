@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Callable, Generic, Sequence, TypeVar
+from uuid import UUID
 
-from tomachess.models import Standings, StandingsItem
+from tomachess.classes.standings_context import StandingsContext
+from tomachess.exceptions import NotFoundError
+from tomachess.models import CompactStandings, Standings
 
 if TYPE_CHECKING:
     from tomachess.base.tournament_base import TournamentBase, TeamTournamentBase
 
 T = TypeVar("T", bound="TournamentBase | TeamTournamentBase")
+SegmentFilter = Callable[[list[UUID], int, int], bool]
 
 
 class StandingsCalculator(Generic[T], ABC):
@@ -17,31 +22,226 @@ class StandingsCalculator(Generic[T], ABC):
     def get_standings(cls, tournament: T) -> Standings:
         pass
 
+    @classmethod
+    @abstractmethod
+    def get_round_standings(cls, tournament: T, rounds: int) -> Standings:
+        pass
+
+    @classmethod
+    def get_standings_history(cls, tournament: T) -> list[Standings]:
+        return [cls.get_round_standings(tournament, rounds) for rounds in range(1, len(tournament.states.results) + 1)]
+
+    @classmethod
+    def get_compact_standings(cls, tournament: T) -> CompactStandings:
+        return CompactStandings.from_standings(cls.get_standings(tournament))
+
+    @classmethod
+    def get_top_standings(cls, tournament: T, k: int) -> Standings:
+        return Standings(items=cls.get_standings(tournament).items[:k])
+
+    @classmethod
+    def get_standings_page(cls, tournament: T, page: int, page_size: int) -> Standings:
+        return Standings(items=cls.get_standings(tournament).items[page * page_size:(page + 1) * page_size])
+
+    @classmethod
+    def get_rank(cls, tournament: T, uuid: UUID) -> int:
+        items = cls.get_standings(tournament).items
+        scores = next((item.scores for item in items if item.participant.uuid == uuid), None)
+        if scores is None:
+            raise NotFoundError("The participant is not present")
+        return 1 + sum(item.scores > scores for item in items)
+
 
 class DefaultStandingsCalculator(StandingsCalculator[T], Generic[T]):
     @classmethod
-    def get_standings(cls, tournament: T) -> Standings:
-        scoring_system = tournament.parameters.scoring_system
-        participant_dict = tournament.get_participant_dict()
-        point_score_dict = {uuid: 0.0 for uuid in participant_dict.keys()}
-
-        for round_result in tournament.states.results.rounds:
-            for game in round_result.items:
-                if game.uuid_1 is not None:
-                    point_score_dict[game.uuid_1] += scoring_system.get_points(game.result_1)
-                if game.uuid_2 is not None:
-                    point_score_dict[game.uuid_2] += scoring_system.get_points(game.result_2)
-
-        score_dicts = (point_score_dict,) + tuple(
-            criterium.compute_tiebreak(tournament)  # type: ignore[arg-type]
+    def _get_context(cls, tournament: T) -> StandingsContext:
+        return StandingsContext.from_tournament(tournament)
+
+    @classmethod
+    def _get_score_dicts(cls, tournament: T, context: StandingsContext) -> tuple[dict[UUID, float], ...]:
+        return (context.point_scores,) + tuple(
+            criterium.compute_tiebreak(tournament, context)  # type: ignore[arg-type]
             for criterium in tournament.parameters.tiebreaks.criteria
         )
 
-        standings_items = [
-            StandingsItem(
-                participant=participant_dict[uuid],
-                scores=tuple(score_dict[uuid] for score_dict in score_dicts)
-            )
-            for uuid in participant_dict.keys()
+    @classmethod
+    def _get_score_tuples(cls, tournament: T, context: StandingsContext) -> dict[UUID, tuple[float, ...]]:
+        score_dicts = cls._get_score_dicts(tournament, context)
+        return {
+            uuid: tuple(score_dict[uuid] for score_dict in score_dicts)
+            for uuid in context.participant_dict.keys()
+        }
+
+    @staticmethod
+    def _get_ranks(order: Sequence[UUID], scores: dict[UUID, tuple[float, ...]]) -> list[int]:
+        ranks: list[int] = []
+        for position, uuid in enumerate(order):
+            if position > 0 and scores[uuid] == scores[order[position - 1]]:
+                ranks.append(ranks[-1])
+            else:
+                ranks.append(position + 1)
+        return ranks
+
+    @classmethod
+    def _create_compact_standings(
+            cls,
+            context: StandingsContext,
+            order: Sequence[UUID],
+            scores: dict[UUID, tuple[float, ...]],
+            start: int = 0
+    ) -> CompactStandings:
+        ranks = cls._get_ranks(order, scores)
+        participant_dict = {uuid: context.participant_dict[uuid] for uuid in order[start:]}
+        return CompactStandings.from_scores(order[start:], scores, ranks[start:], participant_dict)
+
+    @classmethod
+    def _get_compact_standings(cls, tournament: T, context: StandingsContext) -> CompactStandings:
+        scores = cls._get_score_tuples(tournament, context)
+        order = sorted(context.participant_dict.keys(), key=scores.__getitem__, reverse=True)
+        return cls._create_compact_standings(context, order, scores)
+
+    @classmethod
+    def _get_standings(cls, tournament: T, context: StandingsContext) -> Standings:
+        return cls._get_compact_standings(tournament, context).to_standings()
+
+    @classmethod
+    def get_standings(cls, tournament: T) -> Standings:
+        return cls._get_standings(tournament, cls._get_context(tournament))
+
+    @classmethod
+    def get_compact_standings(cls, tournament: T) -> CompactStandings:
+        return cls._get_compact_standings(tournament, cls._get_context(tournament))
+
+    @classmethod
+    def get_round_standings(cls, tournament: T, rounds: int) -> Standings:
+        context = StandingsContext(tournament, tournament.build_standings_accumulator(rounds))
+        return cls._get_standings(tournament, context)
+
+    @classmethod
+    def get_standings_history(cls, tournament: T) -> list[Standings]:
+        return [
+            cls._get_standings(tournament, StandingsContext(tournament, accumulator))
+            for accumulator in tournament.iterate_standings_accumulators()
         ]
-        return Standings(items=sorted(standings_items, key=lambda item: item.scores, reverse=True))
+
+    @classmethod
+    def get_top_standings(cls, tournament: T, k: int) -> Standings:
+        context = cls._get_context(tournament)
+        scores = cls._get_score_tuples(tournament, context)
+        order = heapq.nlargest(k, context.participant_dict.keys(), key=scores.__getitem__)
+        return cls._create_compact_standings(context, order, scores).to_standings()
+
+    @classmethod
+    def get_standings_page(cls, tournament: T, page: int, page_size: int) -> Standings:
+        context = cls._get_context(tournament)
+        scores = cls._get_score_tuples(tournament, context)
+        order = heapq.nlargest((page + 1) * page_size, context.participant_dict.keys(), key=scores.__getitem__)
+        return cls._create_compact_standings(context, order, scores, page * page_size).to_standings()
+
+    @classmethod
+    def get_rank(cls, tournament: T, uuid: UUID) -> int:
+        context = cls._get_context(tournament)
+        if uuid not in context.participant_dict:
+            raise NotFoundError("The participant is not present")
+        scores = cls._get_score_tuples(tournament, context)
+        return 1 + sum(score > scores[uuid] for score in scores.values())
+
+
+class IncrementalStandingsCalculator(DefaultStandingsCalculator[T], Generic[T]):
+    @classmethod
+    def _get_context(cls, tournament: T) -> StandingsContext:
+        return StandingsContext.from_tournament(tournament, incremental=True)
+
+    @classmethod
+    def is_consistent(cls, tournament: T) -> bool:
+        return cls.get_standings(tournament) == DefaultStandingsCalculator.get_standings(tournament)
+
+
+class LazyStandingsCalculator(IncrementalStandingsCalculator[T], Generic[T]):
+    @staticmethod
+    def _get_tied_segments(
+            order: list[UUID],
+            scores: dict[UUID, tuple[float, ...]],
+            segments: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        tied_segments = []
+        for start, end in segments:
+            segment_start = start
+            for i in range(start + 1, end + 1):
+                if i == end or scores[order[i]][-1] != scores[order[segment_start]][-1]:
+                    if i - segment_start > 1:
+                        tied_segments.append((segment_start, i))
+                    segment_start = i
+        return tied_segments
+
+    @classmethod
+    def _complete_scores(
+            cls,
+            tournament: T,
+            context: StandingsContext,
+            order: Sequence[UUID],
+            scores: dict[UUID, tuple[float, ...]]
+    ) -> None:
+        for position, criterium in enumerate(tournament.parameters.tiebreaks.criteria, start=1):
+            uuids = [uuid for uuid in order if len(scores[uuid]) == position]
+            if not uuids:
+                continue
+            score_dict = criterium.compute_partial_tiebreak(tournament, uuids, context)  # type: ignore[arg-type]
+            for uuid in uuids:
+                scores[uuid] += (score_dict[uuid],)
+
+    @classmethod
+    def _get_order(
+            cls,
+            tournament: T,
+            context: StandingsContext,
+            is_needed: SegmentFilter | None = None
+    ) -> tuple[list[UUID], dict[UUID, tuple[float, ...]]]:
+        participant_dict = context.participant_dict
+        scores: dict[UUID, tuple[float, ...]] = {uuid: (score,) for uuid, score in context.point_scores.items()}
+        order = sorted(participant_dict.keys(), key=lambda uuid: scores[uuid], reverse=True)
+        segments = [(0, len(order))]
+
+        for criterium in tournament.parameters.tiebreaks.criteria:
+            segments = cls._get_tied_segments(order, scores, segments)
+            if is_needed is not None:
+                segments = [(start, end) for start, end in segments if is_needed(order, start, end)]
+            if not segments:
+                break
+            uuids = [uuid for start, end in segments for uuid in order[start:end]]
+            score_dict = criterium.compute_partial_tiebreak(tournament, uuids, context)  # type: ignore[arg-type]
+            for uuid in uuids:
+                scores[uuid] += (score_dict[uuid],)
+            for start, end in segments:
+                order[start:end] = sorted(order[start:end], key=lambda uuid: scores[uuid][-1], reverse=True)
+        return order, scores
+
+    @classmethod
+    def _get_compact_standings(cls, tournament: T, context: StandingsContext) -> CompactStandings:
+        order, scores = cls._get_order(tournament, context)
+        cls._complete_scores(tournament, context, order, scores)
+        return cls._create_compact_standings(context, order, scores)
+
+    @classmethod
+    def get_top_standings(cls, tournament: T, k: int) -> Standings:
+        context = cls._get_context(tournament)
+        order, scores = cls._get_order(tournament, context, lambda _, start, end: start < k)
+        cls._complete_scores(tournament, context, order[:k], scores)
+        return cls._create_compact_standings(context, order[:k], scores).to_standings()
+
+    @classmethod
+    def get_standings_page(cls, tournament: T, page: int, page_size: int) -> Standings:
+        context = cls._get_context(tournament)
+        first, last = page * page_size, (page + 1) * page_size
+        order, scores = cls._get_order(tournament, context, lambda _, start, end: start < last and end > first)
+        order = order[:last]
+        cls._complete_scores(tournament, context, order[first:], scores)
+        return cls._create_compact_standings(context, order, scores, first).to_standings()
+
+    @classmethod
+    def get_rank(cls, tournament: T, uuid: UUID) -> int:
+        context = cls._get_context(tournament)
+        if uuid not in context.participant_dict:
+            raise NotFoundError("The participant is not present")
+        order, scores = cls._get_order(tournament, context, lambda order, start, end: uuid in order[start:end])
+        return cls._get_ranks(order, scores)[order.index(uuid)]
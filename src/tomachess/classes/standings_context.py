@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
+from uuid import UUID
+
+from tomachess.classes.standings_accumulator import GameRecord, StandingsAccumulator
+from tomachess.exceptions import NotFoundError
+
+if TYPE_CHECKING:
+    from tomachess.base.tournament_base import AbstractTournamentBase
+
+U = TypeVar("U")
+TableFunction = Callable[["StandingsContext"], Any]
+
+
+class StandingsContext:
+    _TABLES: ClassVar[dict[str, TableFunction]] = {}
+
+    def __init__(self, tournament: AbstractTournamentBase[Any], accumulator: StandingsAccumulator) -> None:
+        self.tournament = tournament
+        self.accumulator = accumulator
+        self.participant_dict = tournament.get_participant_dict()
+        scoring_system = tournament.parameters.scoring_system
+        self.point_scores = accumulator.get_point_scores(self.participant_dict.keys(), scoring_system)
+        self._tables: dict[str, Any] = {}
+
+    @classmethod
+    def from_tournament(cls, tournament: AbstractTournamentBase[Any], incremental: bool = False) -> StandingsContext:
+        if incremental:
+            return cls(tournament, tournament.get_standings_accumulator())
+        return cls(tournament, tournament.build_standings_accumulator())
+
+    @classmethod
+    def register_table(cls, name: str) -> Callable[[Callable[[StandingsContext], U]], Callable[[StandingsContext], U]]:
+        def decorator(table_function: Callable[[StandingsContext], U]) -> Callable[[StandingsContext], U]:
+            cls._TABLES[name] = table_function
+            return table_function
+        return decorator
+
+    def get_table(self, name: str) -> Any:
+        if name not in self._tables:
+            if name not in self._TABLES:
+                raise NotFoundError(f"No table registered under '{name}'")
+            self._tables[name] = self._TABLES[name](self)
+        return self._tables[name]
+
+    def get_games(self, uuid: UUID) -> list[GameRecord]:
+        return self.accumulator.games.get(uuid, [])
+
+    def get_opponents(self, uuid: UUID) -> list[UUID]:
+        opponent_dict: dict[UUID, list[UUID]] = self.get_table("opponents")
+        return opponent_dict.get(uuid, [])
+
+
+@StandingsContext.register_table("opponents")
+def _get_opponent_table(context: StandingsContext) -> dict[UUID, list[UUID]]:
+    return {
+        uuid: [uuid_opp for uuid_opp, result in records if uuid_opp is not None and not result.unplayed]
+        for uuid, records in context.accumulator.games.items()
+    }
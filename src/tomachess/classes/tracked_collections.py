@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from functools import wraps
+from itertools import count
+from typing import Any, Callable, Iterable, TypeVar, get_args
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+T = TypeVar("T")
+C = TypeVar("C", bound=Callable[..., Any])
+
+_REVISIONS = count()
+
+
+def _tracked(method: C) -> C:
+    @wraps(method)
+    def wrapper(collection: Any, *args: Any, **kwargs: Any) -> Any:
+        result = method(collection, *args, **kwargs)
+        collection.revision = next(_REVISIONS)
+        return result
+    return wrapper  # type: ignore[return-value]
+
+
+def _get_schema(cls: type[Any], container: type[Any], source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+    container_schema = handler.generate_schema(container[get_args(source_type) or Any])
+    from_container_schema = core_schema.no_info_after_validator_function(cls, container_schema)
+    return core_schema.json_or_python_schema(
+        json_schema=from_container_schema,
+        python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_container_schema]),
+        serialization=core_schema.plain_serializer_function_ser_schema(container, return_schema=container_schema)
+    )
+
+
+class TrackedList(list[T]):
+    def __init__(self, iterable: Iterable[T] = ()) -> None:
+        super().__init__(iterable)
+        self.revision: int = next(_REVISIONS)
+
+    def __reduce__(self) -> tuple[type[TrackedList[Any]], tuple[list[T]]]:
+        return type(self), (list(self),)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return _get_schema(cls, list, source_type, handler)
+
+    append = _tracked(list.append)
+    extend = _tracked(list.extend)
+    insert = _tracked(list.insert)
+    remove = _tracked(list.remove)
+    pop = _tracked(list.pop)
+    clear = _tracked(list.clear)
+    sort = _tracked(list.sort)
+    reverse = _tracked(list.reverse)
+    __setitem__ = _tracked(list.__setitem__)
+    __delitem__ = _tracked(list.__delitem__)
+    __iadd__ = _tracked(list.__iadd__)
+    __imul__ = _tracked(list.__imul__)
+
+
+class TrackedSet(set[T]):
+    def __init__(self, iterable: Iterable[T] = ()) -> None:
+        super().__init__(iterable)
+        self.revision: int = next(_REVISIONS)
+
+    def __reduce__(self) -> tuple[type[TrackedSet[Any]], tuple[set[T]]]:
+        return type(self), (set(self),)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return _get_schema(cls, set, source_type, handler)
+
+    add = _tracked(set.add)
+    discard = _tracked(set.discard)
+    remove = _tracked(set.remove)
+    pop = _tracked(set.pop)
+    clear = _tracked(set.clear)
+    update = _tracked(set.update)
+    difference_update = _tracked(set.difference_update)
+    intersection_update = _tracked(set.intersection_update)
+    symmetric_difference_update = _tracked(set.symmetric_difference_update)
+    __ior__ = _tracked(set.__ior__)
+    __iand__ = _tracked(set.__iand__)
+    __isub__ = _tracked(set.__isub__)
+    __ixor__ = _tracked(set.__ixor__)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Self, TypeVar
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from tomachess.classes.standings_accumulator import StandingsAccumulator
+from tomachess.classes.standings_calculator import IncrementalStandingsCalculator
+from tomachess.classes.standings_context import StandingsContext
+from tomachess.parameter.tiebreaks.criteria import AbstractCriterium, BoardPoints, Buchholz, SonnebornBerger
+from tomachess.state.results import IndividualResult
+
+if TYPE_CHECKING:
+    from tomachess.base.tournament_base import TournamentBase, TeamTournamentBase
+    from tomachess.parameter import ScoringSystem
+
+T = TypeVar("T", bound="TournamentBase | TeamTournamentBase")
+
+IntArray = npt.NDArray[np.int64]
+FloatArray = npt.NDArray[np.float64]
+
+RESULT_CODES = {result: code for code, result in enumerate(IndividualResult)}
+UNPLAYED = np.array([result.unplayed for result in IndividualResult], dtype=np.bool_)
+
+
+def get_points_table(scoring_system: ScoringSystem) -> FloatArray:
+    return np.array(scoring_system.get_compiled().values, dtype=np.float64)
+
+
+class ResultArrays:
+    def __init__(self, players: IntArray, opponents: IntArray, codes: IntArray) -> None:
+        self.players = players
+        self.opponents = opponents
+        self.codes = codes
+
+    @classmethod
+    def from_accumulator(cls, accumulator: StandingsAccumulator, index: dict[UUID, int]) -> Self:
+        players: list[int] = []
+        opponents: list[int] = []
+        codes: list[int] = []
+        for uuid, records in accumulator.games.items():
+            for uuid_opp, result in records:
+                players.append(index[uuid])
+                opponents.append(-1 if uuid_opp is None else index[uuid_opp])
+                codes.append(RESULT_CODES[result])
+        return cls(
+            np.array(players, dtype=np.int64),
+            np.array(opponents, dtype=np.int64),
+            np.array(codes, dtype=np.int64)
+        )
+
+    def get_point_scores(self, points_table: FloatArray, size: int) -> FloatArray:
+        point_scores = np.zeros(size, dtype=np.float64)
+        np.add.at(point_scores, self.players, points_table[self.codes])
+        return point_scores
+
+    def get_reference_scores(self, point_scores: FloatArray) -> FloatArray:
+        references = np.where(UNPLAYED[self.codes], self.players, self.opponents)
+        return point_scores[references]
+
+
+class BoardResultArrays:
+    def __init__(self, sides: IntArray, side_teams: IntArray, codes: IntArray) -> None:
+        self.sides = sides
+        self.side_teams = side_teams
+        self.codes = codes
+
+    @classmethod
+    def from_accumulator(cls, accumulator: StandingsAccumulator, index: dict[UUID, int]) -> Self:
+        sides: list[int] = []
+        side_teams: list[int] = []
+        codes: list[int] = []
+        for uuid, team_games in accumulator.team_games.items():
+            for key in sorted(team_games):
+                sides.extend([len(side_teams)] * len(team_games[key]))
+                side_teams.append(index[uuid])
+                codes.extend(RESULT_CODES[result] for result in team_games[key])
+        return cls(
+            np.array(sides, dtype=np.int64),
+            np.array(side_teams, dtype=np.int64),
+            np.array(codes, dtype=np.int64)
+        )
+
+    def get_board_points(self, points_table: FloatArray, size: int) -> FloatArray:
+        side_scores = np.zeros(len(self.side_teams), dtype=np.float64)
+        np.add.at(side_scores, self.sides, points_table[self.codes])
+        board_points = np.zeros(size, dtype=np.float64)
+        np.add.at(board_points, self.side_teams, side_scores)
+        return board_points
+
+
+class VectorizedContext:
+    def __init__(self, tournament: Any, context: StandingsContext) -> None:
+        keys = tournament.get_participant_index().keys
+        self.context = context
+        self.index = keys.positions
+        self.uuids = list(context.participant_dict.keys())
+        self.positions = np.array([self.index[uuid] for uuid in self.uuids], dtype=np.int64)
+        self.result_arrays = ResultArrays.from_accumulator(context.accumulator, self.index)
+        self.size = len(keys)
+        self.points_table = get_points_table(tournament.parameters.scoring_system)
+        self.point_scores = self.result_arrays.get_point_scores(self.points_table, self.size)
+
+    def to_dict(self, scores: FloatArray) -> dict[UUID, float]:
+        return dict(zip(self.uuids, scores[self.positions].tolist()))
+
+
+def _compute_buchholz(tournament: Any, vectorized_context: VectorizedContext) -> FloatArray:
+    arrays = vectorized_context.result_arrays
+    buchholz = np.zeros(vectorized_context.size, dtype=np.float64)
+    np.add.at(buchholz, arrays.players, arrays.get_reference_scores(vectorized_context.point_scores))
+    return buchholz
+
+
+def _compute_sonneborn_berger(tournament: Any, vectorized_context: VectorizedContext) -> FloatArray:
+    arrays = vectorized_context.result_arrays
+    game_scores = arrays.get_reference_scores(vectorized_context.point_scores)
+    game_scores = game_scores * vectorized_context.points_table[arrays.codes]
+    sonneborn_berger = np.zeros(vectorized_context.size, dtype=np.float64)
+    np.add.at(sonneborn_berger, arrays.players, game_scores)
+    return sonneborn_berger
+
+
+def _compute_board_points(tournament: Any, vectorized_context: VectorizedContext) -> FloatArray:
+    arrays = BoardResultArrays.from_accumulator(vectorized_context.context.accumulator, vectorized_context.index)
+    points_table = get_points_table(tournament.parameters.board_scoring_system)
+    return arrays.get_board_points(points_table, vectorized_context.size)
+
+
+VECTORIZED_CRITERIA: dict[type[AbstractCriterium[Any]], Callable[[Any, VectorizedContext], FloatArray]] = {
+    Buchholz: _compute_buchholz,
+    SonnebornBerger: _compute_sonneborn_berger,
+    BoardPoints: _compute_board_points
+}
+
+
+class VectorizedStandingsCalculator(IncrementalStandingsCalculator[T], Generic[T]):
+    @staticmethod
+    def _get_vectorized_function(
+            criterium: AbstractCriterium[Any]
+    ) -> Callable[[Any, VectorizedContext], FloatArray] | None:
+        for criterium_class, compute in VECTORIZED_CRITERIA.items():
+            if isinstance(criterium, criterium_class):
+                return compute
+        return None
+
+    @classmethod
+    def _compute_criteria(
+            cls,
+            tournament: T,
+            context: StandingsContext,
+            vectorized_context: VectorizedContext,
+            criteria: Iterable[AbstractCriterium[Any]]
+    ) -> tuple[dict[UUID, float], ...]:
+        score_dicts = []
+        for criterium in criteria:
+            compute = cls._get_vectorized_function(criterium)
+            if compute is None:
+                score_dicts.append(criterium.compute_tiebreak(tournament, context))
+            else:
+                score_dicts.append(vectorized_context.to_dict(compute(tournament, vectorized_context)))
+        return tuple(score_dicts)
+
+    @classmethod
+    def _get_score_dicts(cls, tournament: T, context: StandingsContext) -> tuple[dict[UUID, float], ...]:
+        vectorized_context = VectorizedContext(tournament, context)
+        point_score_dict = vectorized_context.to_dict(vectorized_context.point_scores)
+        criteria = tournament.parameters.tiebreaks.criteria
+        return (point_score_dict,) + cls._compute_criteria(tournament, context, vectorized_context, criteria)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from threading import RLock
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+from tomachess.exceptions import TournamentPermissionError
+
+S = TypeVar("S")
+
+
+class Versioning(Generic[S]):
+    def __init__(self, version: int = 0, read_only: bool = False) -> None:
+        self.lock = RLock()
+        self.version: int = version
+        self.read_only: bool = read_only
+        self.depth: int = 0
+        self.snapshot: tuple[int, S] | None = None
+
+    def __reduce__(self) -> tuple[type[Versioning[Any]], tuple[int, bool]]:
+        return type(self), (self.version, self.read_only)
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        if self.read_only:
+            raise TournamentPermissionError("Snapshots are read-only")
+        with self.lock:
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+            if not self.depth:
+                self.version += 1
+
+    def get_snapshot(self, create: Callable[[], S]) -> S:
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot[0] == self.version:
+            return snapshot[1]
+        if not self.lock.acquire(blocking=snapshot is None):
+            assert snapshot is not None
+            return snapshot[1]
+        try:
+            snapshot = self.snapshot
+            if snapshot is None or snapshot[0] != self.version:
+                snapshot = (self.version, create())
+                self.snapshot = snapshot
+            return snapshot[1]
+        finally:
+            self.lock.release()
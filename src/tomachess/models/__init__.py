@@ -1,6 +1,16 @@
 from tomachess.models.entity import Entity
 from tomachess.models.parameter import Parameter
-from tomachess.models.standings import Standings, StandingsItem
+from tomachess.models.standings import CompactStandings, CompactStandingsItem, Standings, StandingsItem
 from tomachess.models.state import State
+from tomachess.models.trusted import Trusted
 
-__all__ = ["Entity", "Parameter", "Standings", "StandingsItem", "State"]
+__all__ = [
+    "CompactStandings",
+    "CompactStandingsItem",
+    "Entity",
+    "Parameter",
+    "Standings",
+    "StandingsItem",
+    "State",
+    "Trusted"
+]
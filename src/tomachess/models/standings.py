@@ -1,12 +1,77 @@
-from pydantic import BaseModel
+from __future__ import annotations
 
+from typing import Iterator, Mapping, Self, Sequence
+from uuid import UUID
+
+from pydantic import BaseModel, PrivateAttr
+
+from tomachess.exceptions import NotFoundError
+from tomachess.models.trusted import Trusted
 from tomachess.participant import Participant
 
 
 class StandingsItem(BaseModel):
     participant: Participant
     scores: tuple[float, ...]
+    rank: int | None = None
 
 
 class Standings(BaseModel):
     items: list[StandingsItem]
+
+
+class CompactStandingsItem(BaseModel):
+    uuid: UUID
+    scores: tuple[float, ...]
+    rank: int | None = None
+
+
+class CompactStandings(BaseModel):
+    items: list[CompactStandingsItem]
+
+    _participant_dict: Mapping[UUID, Participant] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_scores(
+            cls,
+            order: Sequence[UUID],
+            scores: Mapping[UUID, tuple[float, ...]],
+            ranks: Sequence[int | None],
+            participant_dict: Mapping[UUID, Participant]
+    ) -> Self:
+        items = [
+            Trusted.construct(CompactStandingsItem, uuid=uuid, scores=scores[uuid], rank=rank)
+            for uuid, rank in zip(order, ranks)
+        ]
+        compact_standings = Trusted.construct(cls, items=items)
+        compact_standings._participant_dict = participant_dict
+        return compact_standings
+
+    @classmethod
+    def from_standings(cls, standings: Standings) -> Self:
+        participant_dict = {item.participant.uuid: item.participant for item in standings.items}
+        scores = {item.participant.uuid: item.scores for item in standings.items}
+        ranks = [item.rank for item in standings.items]
+        return cls.from_scores(list(participant_dict.keys()), scores, ranks, participant_dict)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def bind(self, participant_dict: Mapping[UUID, Participant]) -> None:
+        self._participant_dict = participant_dict
+
+    def get_participant(self, uuid: UUID) -> Participant:
+        if uuid not in self._participant_dict:
+            raise NotFoundError("The participant is not present")
+        return self._participant_dict[uuid]
+
+    def iter_participants(self) -> Iterator[tuple[Participant, CompactStandingsItem]]:
+        for item in self.items:
+            yield self.get_participant(item.uuid), item
+
+    def to_standings(self) -> Standings:
+        items = [
+            StandingsItem(participant=participant, scores=item.scores, rank=item.rank)
+            for participant, item in self.iter_participants()
+        ]
+        return Standings(items=items)
@@ -0,0 +1,24 @@
+from os import environ
+from typing import Any, ClassVar, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class Trusted:
+    _DEBUG: ClassVar[bool] = environ.get("TOMACHESS_DEBUG_VALIDATION", "0") not in ("", "0")
+
+    @classmethod
+    def set_debug(cls, debug: bool) -> None:
+        cls._DEBUG = debug
+
+    @classmethod
+    def is_debug(cls) -> bool:
+        return cls._DEBUG
+
+    @classmethod
+    def construct(cls, model_cls: Type[M], **data: Any) -> M:
+        if cls._DEBUG:
+            return model_cls(**data)
+        return model_cls.model_construct(**data)
@@ -1,4 +1,4 @@
-from tomachess.parameter.scoring_system import ScoringSystem
+from tomachess.parameter.scoring_system import CompiledScoringSystem, ScoringSystem
 from tomachess.parameter.tiebreaks import TeamTiebreaks, Tiebreaks
 
-__all__ = ["ScoringSystem", "TeamTiebreaks", "Tiebreaks"]
+__all__ = ["CompiledScoringSystem", "ScoringSystem", "TeamTiebreaks", "Tiebreaks"]
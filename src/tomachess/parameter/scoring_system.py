@@ -1,14 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Self
+
+from pydantic import PrivateAttr
+
 from tomachess.models.parameter import Parameter
 from tomachess.state.results import IndividualResult
 
 
+class CompiledScoringSystem:
+    def __init__(self, scoring_system: ScoringSystem) -> None:
+        self.values: tuple[float, ...] = tuple(scoring_system.compute_points(result) for result in IndividualResult)
+        self.points: dict[IndividualResult, float] = dict(zip(IndividualResult, self.values))
+
+    def get_points(self, individual_result: IndividualResult) -> float:
+        return self.points[individual_result]
+
+
 class ScoringSystem(Parameter):
     win: float = 1.0
     draw: float = 0.5
     loss: float = 0.0
     bye: float = 0.0
 
-    def get_points(self, individual_result: IndividualResult) -> float:
+    _compiled: CompiledScoringSystem | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._compiled = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScoringSystem):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._compiled = None
+        return copied
+
+    def compute_points(self, individual_result: IndividualResult) -> float:
         match individual_result:
             case IndividualResult.WIN | IndividualResult.FORFEIT_WIN | IndividualResult.PAIRING_ALLOCATED_BYE:
                 return self.win
@@ -20,3 +52,11 @@ class ScoringSystem(Parameter):
                 return self.bye
             case _:
                 return 0.0
+
+    def get_compiled(self) -> CompiledScoringSystem:
+        if self._compiled is None:
+            self._compiled = CompiledScoringSystem(self)
+        return self._compiled
+
+    def get_points(self, individual_result: IndividualResult) -> float:
+        return self.get_compiled().points[individual_result]
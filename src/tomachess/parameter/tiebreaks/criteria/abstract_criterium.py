@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from tomachess.classes.standings_context import StandingsContext
+
 if TYPE_CHECKING:
     from tomachess.base import AbstractTournamentBase
 
@@ -16,19 +18,24 @@ class AbstractCriterium(BaseModel, Generic[T], ABC):
     type: str
 
     @staticmethod
-    def _get_point_scores(tournament: T) -> dict[UUID, float]:
-        scoring_system = tournament.parameters.scoring_system
-        point_score_dict = {uuid: 0.0 for uuid in tournament.get_participant_dict().keys()}
-
-        for round_result in tournament.states.results.rounds:
-            for game in round_result.items:
-                if game.uuid_1 is not None:
-                    point_score_dict[game.uuid_1] += scoring_system.get_points(game.result_1)
-                if game.uuid_2 is not None:
-                    point_score_dict[game.uuid_2] += scoring_system.get_points(game.result_2)
+    def _get_context(tournament: T, context: StandingsContext | None) -> StandingsContext:
+        if context is None:
+            return StandingsContext.from_tournament(tournament)
+        return context
 
-        return point_score_dict
+    @staticmethod
+    def _get_point_scores(tournament: T, context: StandingsContext | None = None) -> dict[UUID, float]:
+        return AbstractCriterium._get_context(tournament, context).point_scores
 
     @abstractmethod
-    def compute_tiebreak(self, tournament: T) -> dict[UUID, float]:
+    def compute_tiebreak(self, tournament: T, context: StandingsContext | None = None) -> dict[UUID, float]:
         pass
+
+    def compute_partial_tiebreak(
+            self,
+            tournament: T,
+            uuids: Iterable[UUID],
+            context: StandingsContext | None = None
+    ) -> dict[UUID, float]:
+        score_dict = self.compute_tiebreak(tournament, context)
+        return {uuid: score_dict[uuid] for uuid in uuids}
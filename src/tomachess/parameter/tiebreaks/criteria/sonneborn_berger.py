@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Iterable, Literal, TypeVar
 from uuid import UUID
 
-from tomachess.parameter.scoring_system import ScoringSystem
+from tomachess.classes.standings_context import StandingsContext
+from tomachess.parameter.scoring_system import CompiledScoringSystem
 from tomachess.parameter.tiebreaks.criteria.abstract_criterium import AbstractCriterium
-from tomachess.state.results import FinalizedGameResult, IndividualResult
+from tomachess.state.results import IndividualResult
 
 if TYPE_CHECKING:
     from tomachess.base import AbstractTournamentBase
@@ -22,36 +23,32 @@ class SonnebornBerger(AbstractCriterium[T]):
             uuid_opp: UUID | None,
             result: IndividualResult,
             point_score_dict: dict[UUID, float],
-            scoring_system: ScoringSystem
+            scoring_system: CompiledScoringSystem
     ) -> float:
         if result.unplayed:
             return point_score_dict[uuid] * scoring_system.get_points(result)
         assert uuid_opp is not None
         return point_score_dict[uuid_opp] * scoring_system.get_points(result)
 
-    def _handle_game_scores(
+    def compute_partial_tiebreak(
             self,
-            game: FinalizedGameResult,
-            point_score_dict: dict[UUID, float],
-            sobe_score_dict: dict[UUID, float],
-            scoring_system: ScoringSystem
-    ) -> None:
-        uuid_1 = game.uuid_1
-        uuid_2 = game.uuid_2
-        if uuid_1 is not None:
-            score = self._get_game_individual_score(uuid_1, uuid_2, game.result_1, point_score_dict, scoring_system)
-            sobe_score_dict[uuid_1] += score
-        if uuid_2 is not None:
-            score = self._get_game_individual_score(uuid_2, uuid_1, game.result_2, point_score_dict, scoring_system)
-            sobe_score_dict[uuid_2] += score
-
-    def compute_tiebreak(self, tournament: T) -> dict[UUID, float]:
-        scoring_system = tournament.parameters.scoring_system
-        point_score_dict = self._get_point_scores(tournament)
-        sobe_score_dict = {uuid: 0.0 for uuid in tournament.get_participant_uuids()}
-
-        for round_result in tournament.states.results.rounds:
-            for game in round_result.items:
-                self._handle_game_scores(game, point_score_dict, sobe_score_dict, scoring_system)
+            tournament: T,
+            uuids: Iterable[UUID],
+            context: StandingsContext | None = None
+    ) -> dict[UUID, float]:
+        scoring_system = tournament.parameters.scoring_system.get_compiled()
+        context = self._get_context(tournament, context)
+        point_score_dict = context.point_scores
+        sobe_score_dict = {}
+
+        for uuid in uuids:
+            score = 0.0
+            for uuid_opp, result in context.get_games(uuid):
+                score += self._get_game_individual_score(uuid, uuid_opp, result, point_score_dict, scoring_system)
+            sobe_score_dict[uuid] = score
 
         return sobe_score_dict
+
+    def compute_tiebreak(self, tournament: T, context: StandingsContext | None = None) -> dict[UUID, float]:
+        context = self._get_context(tournament, context)
+        return self.compute_partial_tiebreak(tournament, context.point_scores.keys(), context)
@@ -6,6 +6,7 @@ from tomachess.state.pairings.game_pairing_item import (
     GamePairingItemContent
 )
 from tomachess.state.pairings.pairings import FinalizedPairings, Pairings
+from tomachess.state.pairings.pairings_validator import PairingsValidator, PairingViolation
 
 __all__ = [
     "FinalizedGamePairing",
@@ -15,5 +16,7 @@ __all__ = [
     "GamePairing",
     "GamePairingItem",
     "GamePairingItemContent",
-    "Pairings"
+    "PairingViolation",
+    "Pairings",
+    "PairingsValidator"
 ]
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from tomachess.models import Trusted
 from tomachess.state.pairings.game_pairing_item import FinalizedGamePairingItem, GamePairingItem
 
 
@@ -11,6 +12,8 @@ class GamePairing(BaseModel):
     uuid_1: GamePairingItem
     uuid_2: GamePairingItem
 
+    model_config = {"frozen": True}
+
     @staticmethod
     def is_valid(game_pairing: GamePairing) -> bool:
         return all(GamePairingItem.is_valid(item) for item in (game_pairing.uuid_1, game_pairing.uuid_2))
@@ -25,7 +28,7 @@ class GamePairing(BaseModel):
         return all(GamePairingItem.is_finalized(item) for item in (game_pairing.uuid_1, game_pairing.uuid_2))
 
     def is_stricter_than(self, other: GamePairing) -> bool:
-        return self.uuid_1.is_stricter_than(other.uuid_1) and self.uuid_2.is_stricter_than(self.uuid_2)
+        return self.uuid_1.is_stricter_than(other.uuid_1) and self.uuid_2.is_stricter_than(other.uuid_2)
 
 
 class FinalizedGamePairing(GamePairing):
@@ -40,7 +43,8 @@ class FinalizedGamePairing(GamePairing):
             bye_1: bool = False,
             bye_2: bool = False
     ) -> Self:
-        return cls(
+        return Trusted.construct(
+            cls,
             uuid_1=FinalizedGamePairingItem.from_uuid(uuid_1, bye_1),
             uuid_2=FinalizedGamePairingItem.from_uuid(uuid_2, bye_2)
         )
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from uuid import UUID
 from types import EllipsisType
-from typing import Any, Self, TypeGuard
+from typing import Self, TypeGuard
 
 from pydantic import BaseModel, field_serializer, field_validator, model_validator
 
 from tomachess.exceptions import PairingError
+from tomachess.models import Trusted
 
 GamePairingItemContent = EllipsisType | list[UUID] | UUID | None
 FinalizedGamePairingItemContent = UUID | None
@@ -17,27 +18,22 @@ class GamePairingItem(BaseModel):
     bye: bool = False
     nullable: bool = False
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"arbitrary_types_allowed": True, "frozen": True}
 
     @model_validator(mode="after")
     @staticmethod
     def check_validity(model: GamePairingItem) -> GamePairingItem:
-        if model.content == []:
-            raise PairingError("Content can not be an empty list")
-        if model.content is None and model.nullable is False:
-            raise PairingError("Nullable must be 'True' if content is 'None'")
-        if model.bye and model.content is not None:
-            raise PairingError("Content must be 'None' if bye is set to 'True'")
-        if model.bye and model.nullable is not None:
-            raise PairingError("Nullable must be 'False' if bye is set to 'True'")
+        violation = GamePairingItem.get_violation(model)
+        if violation is not None:
+            raise PairingError(violation)
         return model
 
-    @model_validator(mode="after")
+    @field_validator("content", mode="after")
     @staticmethod
-    def unwrap_singleton_list(model: GamePairingItem) -> GamePairingItem:
-        if isinstance(model.content, list) and len(model.content) == 1:
-            model.content = model.content[0]
-        return model
+    def unwrap_singleton_list(v: GamePairingItemContent) -> GamePairingItemContent:
+        if isinstance(v, list) and len(v) == 1:
+            return v[0]
+        return v
 
     @field_validator("content", mode="before")
     @staticmethod
@@ -47,20 +43,24 @@ class GamePairingItem(BaseModel):
         return v
 
     @field_serializer("content")
-    def serialize_ellipsis(self, info: Any) -> dict[str, object]:
-        return {"content": ... if self.content == "..." else self.content}
+    def serialize_ellipsis(self, content: GamePairingItemContent) -> object:
+        return "..." if content is ... else content
 
     @staticmethod
-    def is_valid(game_pairing_item: GamePairingItem) -> bool:
-        if game_pairing_item.content == []:
-            return False
-        if game_pairing_item.content is None and game_pairing_item.nullable is False:
-            return False
+    def get_violation(game_pairing_item: GamePairingItem) -> str | None:
+        if isinstance(game_pairing_item.content, list) and not game_pairing_item.content:
+            return "Content can not be an empty list"
         if game_pairing_item.bye and game_pairing_item.content is not None:
-            return False
-        if game_pairing_item.bye and game_pairing_item.nullable is not None:
-            return False
-        return True
+            return "Content must be 'None' if bye is set to 'True'"
+        if game_pairing_item.bye and game_pairing_item.nullable:
+            return "Nullable must be 'False' if bye is set to 'True'"
+        if game_pairing_item.content is None and not game_pairing_item.nullable and not game_pairing_item.bye:
+            return "Nullable must be 'True' if content is 'None'"
+        return None
+
+    @staticmethod
+    def is_valid(game_pairing_item: GamePairingItem) -> bool:
+        return GamePairingItem.get_violation(game_pairing_item) is None
 
     @staticmethod
     def is_finalized(game_pairing_item: GamePairingItem) -> TypeGuard[FinalizedGamePairingItem]:
@@ -68,11 +68,11 @@ class GamePairingItem(BaseModel):
 
     @classmethod
     def get_free_instance(cls) -> Self:
-        return cls(content=..., bye=False, nullable=True)
+        return Trusted.construct(cls, content=..., bye=False, nullable=True)
 
     @classmethod
     def get_empty_instance(cls, bye: bool = False) -> Self:
-        return cls(content=None, bye=bye, nullable=not bye)
+        return Trusted.construct(cls, content=None, bye=bye, nullable=not bye)
 
     def is_stricter_than(self, other: GamePairingItem) -> bool:
         if not GamePairingItem.is_valid(self):
@@ -116,4 +116,4 @@ class FinalizedGamePairingItem(GamePairingItem):
     def from_uuid(cls, uuid: UUID | None, bye: bool = False) -> Self:
         if uuid is None:
             return cls.get_empty_instance(bye=bye)
-        return cls(content=uuid, bye=False, nullable=False)
+        return Trusted.construct(cls, content=uuid, bye=False, nullable=False)
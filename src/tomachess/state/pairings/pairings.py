@@ -4,6 +4,7 @@ from typing import TypeGuard
 
 from tomachess.models import State
 from tomachess.state.pairings.game_pairing import FinalizedGamePairing, GamePairing
+from tomachess.state.pairings.pairings_validator import PairingsValidator, PairingViolation
 from tomachess.type import RoundIndex
 
 
@@ -11,6 +12,8 @@ class Pairings(State):
     index: RoundIndex
     items: tuple[GamePairing, ...] = ()
 
+    model_config = {"frozen": True}
+
     @staticmethod
     def is_valid(pairings: Pairings) -> bool:
         return all(GamePairing.is_valid(item) for item in pairings.items)
@@ -19,8 +22,14 @@ class Pairings(State):
     def is_finalized(pairings: Pairings) -> TypeGuard[FinalizedPairings]:
         return all(GamePairing.is_finalized(item) for item in pairings.items)
 
+    def get_violations(self, other: Pairings) -> list[PairingViolation]:
+        violations = PairingsValidator(other.items).validate(self.items)
+        if self.index != other.index:
+            violations.insert(0, PairingViolation(None, None, f"Expected round index {other.index}, got {self.index}"))
+        return violations
+
     def is_stricter_than(self, other: Pairings) -> bool:
-        return self.index == other.index and all(s.is_stricter_than(o) for s, o in zip(self.items, other.items))
+        return not self.get_violations(other)
 
 
 class FinalizedPairings(Pairings):
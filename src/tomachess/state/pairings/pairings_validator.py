@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+from uuid import UUID
+
+from tomachess.state.pairings.game_pairing import GamePairing
+from tomachess.state.pairings.game_pairing_item import GamePairingItem
+
+
+class PairingViolation(NamedTuple):
+    board: int | None
+    side: int | None
+    message: str
+
+    def __str__(self) -> str:
+        if self.board is None:
+            return self.message
+        if self.side is None:
+            return f"Board {self.board + 1}: {self.message}"
+        return f"Board {self.board + 1}, side {self.side}: {self.message}"
+
+
+class ItemConstraint(NamedTuple):
+    bye: bool
+    nullable: bool
+    allowed: frozenset[UUID] | None
+
+
+class PairingsValidator:
+    def __init__(self, items: Sequence[GamePairing]) -> None:
+        self.constraints: list[tuple[ItemConstraint, ItemConstraint]] = [
+            (self._compile(item.uuid_1), self._compile(item.uuid_2)) for item in items
+        ]
+
+    @staticmethod
+    def _compile(item: GamePairingItem) -> ItemConstraint:
+        content = item.content
+        allowed: frozenset[UUID] | None
+        if content is ...:
+            allowed = None
+        elif content is None:
+            allowed = frozenset()
+        elif isinstance(content, list):
+            allowed = frozenset(content)
+        else:
+            allowed = frozenset((content,))
+        return ItemConstraint(bye=item.bye, nullable=item.nullable, allowed=allowed)
+
+    @staticmethod
+    def _get_refinement_violation(item: GamePairingItem, constraint: ItemConstraint) -> str | None:
+        if item.bye != constraint.bye:
+            return "Bye does not match the current pairing"
+        if item.bye:
+            return None
+        if item.nullable and not constraint.nullable:
+            return "Item may not be nullable"
+        content, allowed = item.content, constraint.allowed
+        if allowed is None or content is None:
+            return None
+        if content is ...:
+            return "Item may not be looser than the current pairing"
+        if isinstance(content, list):
+            return None if allowed.issuperset(content) else "Some options are not allowed by the current pairing"
+        return None if content in allowed else "Participant is not allowed by the current pairing"
+
+    def validate(self, items: Sequence[GamePairing]) -> list[PairingViolation]:
+        violations: list[PairingViolation] = []
+        if len(items) != len(self.constraints):
+            violations.append(
+                PairingViolation(None, None, f"Expected {len(self.constraints)} boards, got {len(items)}")
+            )
+        seen: set[UUID] = set()
+        for board, (item, constraints) in enumerate(zip(items, self.constraints)):
+            for side, pairing_item, constraint in ((1, item.uuid_1, constraints[0]), (2, item.uuid_2, constraints[1])):
+                message = GamePairingItem.get_violation(pairing_item)
+                if message is None:
+                    message = self._get_refinement_violation(pairing_item, constraint)
+                if message is not None:
+                    violations.append(PairingViolation(board, side, message))
+                content = pairing_item.content
+                if isinstance(content, UUID):
+                    if content in seen:
+                        violations.append(PairingViolation(board, side, f"Participant {content} appears twice"))
+                    seen.add(content)
+        return violations
+
+    def is_satisfied_by(self, items: Sequence[GamePairing]) -> bool:
+        return not self.validate(items)
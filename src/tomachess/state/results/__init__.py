@@ -1,6 +1,20 @@
+from tomachess.state.results.compact_rounds import CompactRounds, GameColumns, KeySpace
+from tomachess.state.results.cross_table import CrossTable, CrossTableEntry
 from tomachess.state.results.game_result import GameResult, FinalizedGameResult
 from tomachess.state.results.individual_result import IndividualResult
 from tomachess.state.results.results import Results
 from tomachess.state.results.round_result import FinalizedRoundResult, RoundResult
 
-__all__ = ["FinalizedRoundResult", "FinalizedGameResult", "GameResult", "IndividualResult", "Results", "RoundResult"]
+__all__ = [
+    "CompactRounds",
+    "CrossTable",
+    "CrossTableEntry",
+    "FinalizedRoundResult",
+    "FinalizedGameResult",
+    "GameColumns",
+    "GameResult",
+    "IndividualResult",
+    "KeySpace",
+    "Results",
+    "RoundResult"
+]
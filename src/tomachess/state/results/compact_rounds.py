@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from array import array
+from copy import copy
+from threading import Lock
+from typing import Any, Iterable, Iterator, Sequence, overload
+from uuid import UUID
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+from tomachess.models import Trusted
+from tomachess.state.results.game_result import FinalizedGameResult
+from tomachess.state.results.individual_result import IndividualResult
+from tomachess.state.results.round_result import FinalizedRoundResult
+from tomachess.type import RoundIndex
+
+NONE = -1
+
+RESULT_CODES: tuple[IndividualResult, ...] = tuple(IndividualResult)
+_CODES: dict[IndividualResult, int] = {result: code for code, result in enumerate(RESULT_CODES)}
+
+
+class KeySpace:
+    def __init__(self, uuids: Iterable[UUID] = ()) -> None:
+        self.lock = Lock()
+        self.uuids: list[UUID] = []
+        self.positions: dict[UUID, int] = {}
+        for uuid in uuids:
+            self.add(uuid)
+
+    def __reduce__(self) -> tuple[type[KeySpace], tuple[list[UUID]]]:
+        return type(self), (list(self.uuids),)
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def add(self, uuid: UUID) -> int:
+        position = self.positions.get(uuid)
+        if position is not None:
+            return position
+        with self.lock:
+            position = self.positions.get(uuid)
+            if position is None:
+                position = len(self.uuids)
+                self.uuids.append(uuid)
+                self.positions[uuid] = position
+        return position
+
+    def find(self, uuid: UUID) -> int | None:
+        return self.positions.get(uuid)
+
+    def get_uuid(self, position: int) -> UUID:
+        return self.uuids[position]
+
+
+class GameColumns:
+    def __init__(self, keys: KeySpace | None = None) -> None:
+        self.keys = KeySpace() if keys is None else keys
+        self.participants_1: array[int] = array("l")
+        self.participants_2: array[int] = array("l")
+        self.results_1: array[int] = array("B")
+        self.results_2: array[int] = array("B")
+
+    def __len__(self) -> int:
+        return len(self.results_1)
+
+    def get_position(self, uuid: UUID | None) -> int:
+        return NONE if uuid is None else self.keys.add(uuid)
+
+    def get_uuid(self, position: int) -> UUID | None:
+        return None if position == NONE else self.keys.get_uuid(position)
+
+    def append(self, game: FinalizedGameResult) -> None:
+        self.participants_1.append(self.get_position(game.uuid_1))
+        self.participants_2.append(self.get_position(game.uuid_2))
+        self.results_1.append(_CODES[game.result_1])
+        self.results_2.append(_CODES[game.result_2])
+
+    def copy(self) -> GameColumns:
+        game_columns = copy(self)
+        game_columns.participants_1 = array("l", self.participants_1)
+        game_columns.participants_2 = array("l", self.participants_2)
+        game_columns.results_1 = array("B", self.results_1)
+        game_columns.results_2 = array("B", self.results_2)
+        return game_columns
+
+    def truncate(self, size: int) -> None:
+        del self.participants_1[size:]
+        del self.participants_2[size:]
+        del self.results_1[size:]
+        del self.results_2[size:]
+
+    def get_game(self, position: int) -> FinalizedGameResult:
+        return Trusted.construct(
+            FinalizedGameResult,
+            uuid_1=self.get_uuid(self.participants_1[position]),
+            uuid_2=self.get_uuid(self.participants_2[position]),
+            result_1=RESULT_CODES[self.results_1[position]],
+            result_2=RESULT_CODES[self.results_2[position]]
+        )
+
+    def get_games(self, start: int, stop: int) -> tuple[FinalizedGameResult, ...]:
+        return tuple(self.get_game(position) for position in range(start, stop))
+
+    def get_uuids(self, start: int = 0, stop: int | None = None) -> set[UUID | None]:
+        positions = set(self.participants_1[start:stop]) | set(self.participants_2[start:stop])
+        return {self.get_uuid(position) for position in positions}
+
+
+class CompactRounds(Sequence[FinalizedRoundResult]):
+    def __init__(self, rounds: Iterable[FinalizedRoundResult] = ()) -> None:
+        self.columns = GameColumns()
+        self.indices: list[RoundIndex] = []
+        self.offsets: array[int] = array("L", [0])
+        self.shared: bool = False
+        for round_result in rounds:
+            self.append(round_result)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        list_schema = handler.generate_schema(list[FinalizedRoundResult])
+        from_list_schema = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list_schema,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_list_schema]),
+            serialization=core_schema.plain_serializer_function_ser_schema(list, return_schema=list_schema)
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[FinalizedRoundResult]:
+        for position in range(len(self)):
+            yield self._get_round(position)
+
+    @overload
+    def __getitem__(self, key: int) -> FinalizedRoundResult:
+        pass
+
+    @overload
+    def __getitem__(self, key: slice) -> list[FinalizedRoundResult]:
+        pass
+
+    def __getitem__(self, key: int | slice) -> FinalizedRoundResult | list[FinalizedRoundResult]:
+        if isinstance(key, slice):
+            return [self._get_round(position) for position in range(*key.indices(len(self)))]
+        position = key + len(self) if key < 0 else key
+        if not 0 <= position < len(self):
+            raise IndexError("Round position out of range")
+        return self._get_round(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(s == o for s, o in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _get_round(self, position: int) -> FinalizedRoundResult:
+        items = self.columns.get_games(self.offsets[position], self.offsets[position + 1])
+        return Trusted.construct(FinalizedRoundResult, index=list(self.indices[position]), items=items)
+
+    def get_snapshot(self) -> CompactRounds:
+        snapshot = copy(self)
+        snapshot.indices = list(self.indices)
+        snapshot.offsets = array("L", self.offsets)
+        self.shared = snapshot.shared = True
+        return snapshot
+
+    def append(self, round_result: FinalizedRoundResult) -> None:
+        for game in round_result.items:
+            self.columns.append(game)
+        self.indices.append(list(round_result.index))
+        self.offsets.append(len(self.columns))
+
+    def pop(self) -> FinalizedRoundResult:
+        round_result = self[-1]
+        self.indices.pop()
+        self.offsets.pop()
+        if self.shared:
+            self.columns = self.columns.copy()
+            self.shared = False
+        self.columns.truncate(self.offsets[-1])
+        return round_result
+
+    def get_uuids(self) -> set[UUID | None]:
+        return self.columns.get_uuids(stop=self.offsets[-1])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Self
+from uuid import UUID
+
+from tomachess.state.results.individual_result import IndividualResult
+from tomachess.state.results.round_result import FinalizedRoundResult
+from tomachess.type import RoundIndex
+
+
+class CrossTableEntry(NamedTuple):
+    round: int
+    round_index: RoundIndex
+    side: int
+    opponent: UUID | None
+    result: IndividualResult
+
+
+class CrossTable:
+    def __init__(self) -> None:
+        self.rounds: int = 0
+        self.games: dict[UUID, list[CrossTableEntry]] = {}
+        self.head_to_head: dict[tuple[UUID, UUID], list[CrossTableEntry]] = {}
+
+    @classmethod
+    def from_rounds(cls, rounds: Iterable[FinalizedRoundResult]) -> Self:
+        cross_table = cls()
+        for round_result in rounds:
+            cross_table.add_round_result(round_result)
+        return cross_table
+
+    def _add_entry(self, uuid: UUID | None, entry: CrossTableEntry) -> None:
+        if uuid is None:
+            return
+        self.games.setdefault(uuid, []).append(entry)
+        if entry.opponent is not None:
+            self.head_to_head.setdefault((uuid, entry.opponent), []).append(entry)
+
+    def add_round_result(self, round_result: FinalizedRoundResult) -> None:
+        round_index = round_result.index
+        for game in round_result.items:
+            self._add_entry(game.uuid_1, CrossTableEntry(self.rounds, round_index, 1, game.uuid_2, game.result_1))
+            self._add_entry(game.uuid_2, CrossTableEntry(self.rounds, round_index, 2, game.uuid_1, game.result_2))
+        self.rounds += 1
+
+    def get_games(self, uuid: UUID) -> list[CrossTableEntry]:
+        return self.games.get(uuid, [])
+
+    def get_head_to_head(self, uuid: UUID, uuid_opp: UUID) -> list[CrossTableEntry]:
+        return self.head_to_head.get((uuid, uuid_opp), [])
@@ -6,6 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from tomachess.exceptions import ResultError
+from tomachess.models import Trusted
 from tomachess.state.pairings import GamePairing, FinalizedGamePairing, FinalizedGamePairingItem
 from tomachess.state.results.individual_result import IndividualResult
 
@@ -37,8 +38,8 @@ class GameResult(BaseModel):
     def _determine_result(
             item_1: FinalizedGamePairingItem, item_2: FinalizedGamePairingItem
     ) -> tuple[IndividualResult | None, IndividualResult | None]:
-        result_white = GameResult._determine_opponent_result(item_1)
-        result_black = GameResult._determine_opponent_result(item_2)
+        result_white = GameResult._determine_opponent_result(item_2)
+        result_black = GameResult._determine_opponent_result(item_1)
         if item_1.content is None:
             result_white = IndividualResult.UNDEFINED
         if item_2.content is None:
@@ -77,7 +78,8 @@ class GameResult(BaseModel):
         item_2 = game_pairing.uuid_2
         result_1, result_2 = GameResult._determine_result(item_1, item_2)
 
-        return cls(
+        return Trusted.construct(
+            cls,
             uuid_1=item_1.content,
             uuid_2=item_2.content,
             result_1=result_1,
@@ -91,8 +93,8 @@ class GameResult(BaseModel):
         return FinalizedGamePairing.from_uuids(
             uuid_1=self.uuid_1,
             uuid_2=self.uuid_2,
-            bye_1=self.result_1 == IndividualResult.VOLUNTARY_BYE,
-            bye_2=self.result_1 == IndividualResult.VOLUNTARY_BYE,
+            bye_1=self.result_2 == IndividualResult.PAIRING_ALLOCATED_BYE,
+            bye_2=self.result_1 == IndividualResult.PAIRING_ALLOCATED_BYE,
         )
 
 
@@ -101,3 +103,5 @@ class FinalizedGameResult(GameResult):
     uuid_2: UUID | None
     result_1: IndividualResult
     result_2: IndividualResult
+
+    model_config = {"frozen": True}
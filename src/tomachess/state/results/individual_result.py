@@ -11,13 +11,20 @@ class IndividualResult(str, Enum):
     PAIRING_ALLOCATED_BYE = "pairing_allocated_bye"
     UNDEFINED = "undefined"
 
-    _UNPLAYED = {FORFEIT_WIN, FORFEIT_LOSS, VOLUNTARY_BYE, PAIRING_ALLOCATED_BYE, UNDEFINED}
-    _VOLUNTARILY_UNPLAYED = {FORFEIT_LOSS, VOLUNTARY_BYE}
-
     @property
     def unplayed(self) -> bool:
-        return self in self._UNPLAYED
+        return self in _UNPLAYED
 
     @property
     def voluntarily_unplayed(self) -> bool:
-        return self in self._VOLUNTARILY_UNPLAYED
+        return self in _VOLUNTARILY_UNPLAYED
+
+
+_UNPLAYED = frozenset({
+    IndividualResult.FORFEIT_WIN,
+    IndividualResult.FORFEIT_LOSS,
+    IndividualResult.VOLUNTARY_BYE,
+    IndividualResult.PAIRING_ALLOCATED_BYE,
+    IndividualResult.UNDEFINED
+})
+_VOLUNTARILY_UNPLAYED = frozenset({IndividualResult.FORFEIT_LOSS, IndividualResult.VOLUNTARY_BYE})
@@ -1,16 +1,40 @@
+from typing import Self
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from tomachess.models import State
+from tomachess.models import State, Trusted
+from tomachess.state.results.compact_rounds import CompactRounds
+from tomachess.state.results.cross_table import CrossTable, CrossTableEntry
 from tomachess.state.results.round_result import FinalizedRoundResult
 
 
 class Results(State):
-    rounds: list[FinalizedRoundResult] = Field(default_factory=list)
+    rounds: CompactRounds = Field(default_factory=CompactRounds)
+
+    _cross_table: CrossTable | None = PrivateAttr(default=None)
 
     def __len__(self) -> int:
         return len(self.rounds)
 
     def get_uuids(self) -> set[UUID | None]:
-        return set().union(*(item.get_uuids() for item in self.rounds))
+        return self.rounds.get_uuids()
+
+    def get_cross_table(self) -> CrossTable:
+        if self._cross_table is None or self._cross_table.rounds != len(self.rounds):
+            self._cross_table = CrossTable.from_rounds(self.rounds)
+        return self._cross_table
+
+    def get_games(self, uuid: UUID) -> list[CrossTableEntry]:
+        return self.get_cross_table().get_games(uuid)
+
+    def get_head_to_head(self, uuid: UUID, uuid_opp: UUID) -> list[CrossTableEntry]:
+        return self.get_cross_table().get_head_to_head(uuid, uuid_opp)
+
+    def get_snapshot(self) -> Self:
+        return Trusted.construct(type(self), rounds=self.rounds.get_snapshot())
+
+    def add_round_result(self, round_result: FinalizedRoundResult) -> None:
+        cross_table = self.get_cross_table()
+        self.rounds.append(round_result)
+        cross_table.add_round_result(round_result)
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from tomachess.models import Trusted
 from tomachess.state.pairings import FinalizedPairings
 from tomachess.state.results.game_result import FinalizedGameResult, GameResult
 from tomachess.type import RoundIndex
@@ -25,16 +26,18 @@ class RoundResult(BaseModel):
     @classmethod
     def from_pairings(cls, pairings: FinalizedPairings) -> Self:
         items = tuple(GameResult.from_game_pairing(item) for item in pairings.items)
-        return cls(index=pairings.index, items=items)
+        return Trusted.construct(cls, index=list(pairings.index), items=items)
 
     def get_uuids(self) -> set[UUID | None]:
         return set().union(*(item.get_uuids() for item in self.items))
 
     def get_pairings(self) -> FinalizedPairings:
         items = tuple(item.get_game_pairing() for item in self.items)
-        return FinalizedPairings(index=self.index, items=items)
+        return Trusted.construct(FinalizedPairings, index=list(self.index), items=items)
 
 
 class FinalizedRoundResult(RoundResult):
     index: RoundIndex
     items: tuple[FinalizedGameResult, ...]
+
+    model_config = {"frozen": True}
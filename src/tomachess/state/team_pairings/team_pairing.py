@@ -6,7 +6,8 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from tomachess.exceptions import PairingError
-from tomachess.state.pairings import FinalizedGamePairing, GamePairing, GamePairingItem
+from tomachess.models import Trusted
+from tomachess.state.pairings import FinalizedGamePairing, GamePairing, GamePairingItem, PairingsValidator
 
 
 class TeamPairing(BaseModel):
@@ -14,6 +15,8 @@ class TeamPairing(BaseModel):
     team_2: UUID | None
     items: tuple[GamePairing, ...]
 
+    model_config = {"frozen": True}
+
     @staticmethod
     def is_valid(team_pairing: TeamPairing) -> bool:
         return all(GamePairing.is_valid(item) for item in team_pairing.items)
@@ -33,27 +36,31 @@ class TeamPairing(BaseModel):
 
         match (game_pairing.uuid_1.content, game_pairing.uuid_2.content):
             case (None, _):
-                item_template = GamePairing(
+                item_template = Trusted.construct(
+                    GamePairing,
                     uuid_1=GamePairingItem.get_empty_instance(bye=game_pairing.uuid_1.bye),
                     uuid_2=GamePairingItem.get_free_instance()
                 )
             case (_, None):
-                item_template = GamePairing(
+                item_template = Trusted.construct(
+                    GamePairing,
                     uuid_1=GamePairingItem.get_free_instance(),
                     uuid_2=GamePairingItem.get_empty_instance(bye=game_pairing.uuid_2.bye)
                 )
             case _:
-                item_template = GamePairing(
+                item_template = Trusted.construct(
+                    GamePairing,
                     uuid_1=GamePairingItem.get_free_instance(),
                     uuid_2=GamePairingItem.get_free_instance()
                 )
 
-        items = tuple(item_template.model_copy(deep=True) for _ in range(size))
-        return cls(team_1=game_pairing.uuid_1.content, team_2=game_pairing.uuid_2.content, items=items)
+        return Trusted.construct(
+            cls, team_1=game_pairing.uuid_1.content, team_2=game_pairing.uuid_2.content, items=(item_template,) * size
+        )
 
     def is_stricter_than(self, other: TeamPairing) -> bool:
         teams_equal = self.team_1 == other.team_1 and self.team_2 == other.team_2
-        return teams_equal and all(s.is_stricter_than(o) for s, o in zip(self.items, other.items))
+        return teams_equal and PairingsValidator(other.items).is_satisfied_by(self.items)
 
 
 class FinalizedTeamPairing(TeamPairing):
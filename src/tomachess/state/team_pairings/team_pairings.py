@@ -1,8 +1,6 @@
 from typing import Self
 
-from pydantic import Field
-
-from tomachess.models import State
+from tomachess.models import State, Trusted
 from tomachess.state.pairings import FinalizedPairings
 from tomachess.state.team_pairings.team_pairing import TeamPairing
 from tomachess.type import RoundIndex
@@ -10,9 +8,15 @@ from tomachess.type import RoundIndex
 
 class TeamParings(State):
     index: RoundIndex
-    items: list[TeamPairing] = Field(default_factory=list)
+    items: tuple[TeamPairing, ...] = ()
+
+    model_config = {"frozen": True}
 
     @classmethod
     def from_pairings(cls, pairings: FinalizedPairings, size: int) -> Self:
-        items = [TeamPairing.from_game_pairing(game_pairing, size) for game_pairing in pairings.items]
-        return cls(index=pairings.index, items=items)
+        items = tuple(TeamPairing.from_game_pairing(game_pairing, size) for game_pairing in pairings.items)
+        return Trusted.construct(cls, index=list(pairings.index), items=items)
+
+    def with_item(self, index: int, team_pairing: TeamPairing) -> Self:
+        items = self.items[:index] + (team_pairing,) + self.items[index + 1:]
+        return self.model_copy(update={"items": items})
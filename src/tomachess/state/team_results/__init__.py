@@ -1,5 +1,15 @@
+from tomachess.state.team_results.compact_team_rounds import CompactTeamRounds
+from tomachess.state.team_results.team_cross_table import TeamCrossTable, TeamCrossTableEntry
 from tomachess.state.team_results.team_game_result import FinalizedTeamGameResult, TeamGameResult
 from tomachess.state.team_results.team_results import TeamResults
 from tomachess.state.team_results.team_round_result import TeamRoundResult
 
-__all__ = ["FinalizedTeamGameResult", "TeamGameResult", "TeamResults", "TeamRoundResult"]
+__all__ = [
+    "CompactTeamRounds",
+    "FinalizedTeamGameResult",
+    "TeamCrossTable",
+    "TeamCrossTableEntry",
+    "TeamGameResult",
+    "TeamResults",
+    "TeamRoundResult"
+]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from array import array
+from copy import copy
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+from tomachess.models import Trusted
+from tomachess.state.results import GameColumns
+from tomachess.state.team_results.team_game_result import FinalizedTeamGameResult
+from tomachess.state.team_results.team_round_result import TeamRoundResult
+from tomachess.type import RoundIndex
+
+
+class CompactTeamRounds(Sequence[TeamRoundResult]):
+    def __init__(self, rounds: Iterable[TeamRoundResult] = ()) -> None:
+        self.columns = GameColumns()
+        self.teams_1: array[int] = array("l")
+        self.teams_2: array[int] = array("l")
+        self.board_offsets: array[int] = array("L", [0])
+        self.indices: list[RoundIndex] = []
+        self.offsets: array[int] = array("L", [0])
+        self.current: TeamRoundResult | None = None
+        self.shared: bool = False
+        for team_round_result in rounds:
+            self.append(team_round_result)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        list_schema = handler.generate_schema(list[TeamRoundResult])
+        from_list_schema = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list_schema,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_list_schema]),
+            serialization=core_schema.plain_serializer_function_ser_schema(list, return_schema=list_schema)
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices) + (self.current is not None)
+
+    def __iter__(self) -> Iterator[TeamRoundResult]:
+        for position in range(len(self)):
+            yield self._get_round(position)
+
+    @overload
+    def __getitem__(self, key: int) -> TeamRoundResult:
+        pass
+
+    @overload
+    def __getitem__(self, key: slice) -> list[TeamRoundResult]:
+        pass
+
+    def __getitem__(self, key: int | slice) -> TeamRoundResult | list[TeamRoundResult]:
+        if isinstance(key, slice):
+            return [self._get_round(position) for position in range(*key.indices(len(self)))]
+        position = key + len(self) if key < 0 else key
+        if not 0 <= position < len(self):
+            raise IndexError("Round position out of range")
+        return self._get_round(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(s == o for s, o in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _get_team_game(self, position: int) -> FinalizedTeamGameResult:
+        return Trusted.construct(
+            FinalizedTeamGameResult,
+            team_1=self.columns.get_uuid(self.teams_1[position]),
+            team_2=self.columns.get_uuid(self.teams_2[position]),
+            items=self.columns.get_games(self.board_offsets[position], self.board_offsets[position + 1])
+        )
+
+    def _get_round(self, position: int) -> TeamRoundResult:
+        if position == len(self.indices):
+            assert self.current is not None
+            return self.current
+        team_games = range(self.offsets[position], self.offsets[position + 1])
+        items = tuple(self._get_team_game(team_game) for team_game in team_games)
+        return Trusted.construct(TeamRoundResult, index=list(self.indices[position]), items=items)
+
+    def _seal(self, team_round_result: TeamRoundResult) -> None:
+        for team_game_result in team_round_result.items:
+            self.teams_1.append(self.columns.get_position(team_game_result.team_1))
+            self.teams_2.append(self.columns.get_position(team_game_result.team_2))
+            for game in team_game_result.items:
+                self.columns.append(game)
+            self.board_offsets.append(len(self.columns))
+        self.indices.append(list(team_round_result.index))
+        self.offsets.append(len(self.teams_1))
+
+    def _unseal(self) -> TeamRoundResult:
+        team_round_result = self._get_round(len(self.indices) - 1)
+        self.indices.pop()
+        self.offsets.pop()
+        if self.shared:
+            self.columns = self.columns.copy()
+            self.teams_1 = array("l", self.teams_1)
+            self.teams_2 = array("l", self.teams_2)
+            self.board_offsets = array("L", self.board_offsets)
+            self.shared = False
+        del self.teams_1[self.offsets[-1]:]
+        del self.teams_2[self.offsets[-1]:]
+        del self.board_offsets[self.offsets[-1] + 1:]
+        self.columns.truncate(self.board_offsets[-1])
+        return team_round_result
+
+    def get_snapshot(self) -> CompactTeamRounds:
+        snapshot = copy(self)
+        snapshot.indices = list(self.indices)
+        snapshot.offsets = array("L", self.offsets)
+        self.shared = snapshot.shared = True
+        return snapshot
+
+    def append(self, team_round_result: TeamRoundResult) -> None:
+        if self.current is not None:
+            self._seal(self.current)
+        self.current = team_round_result
+
+    def set_current(self, team_round_result: TeamRoundResult) -> None:
+        if self.current is None:
+            raise IndexError("Set on empty rounds")
+        self.current = team_round_result
+
+    def pop(self) -> TeamRoundResult:
+        if self.current is None:
+            raise IndexError("Pop from empty rounds")
+        team_round_result = self.current
+        self.current = self._unseal() if self.indices else None
+        return team_round_result
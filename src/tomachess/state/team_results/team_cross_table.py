@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Self
+from uuid import UUID
+
+from tomachess.state.team_results.team_game_result import FinalizedTeamGameResult, TeamGameResult
+from tomachess.state.team_results.team_round_result import TeamRoundResult
+from tomachess.type import RoundIndex
+
+
+class TeamCrossTableEntry(NamedTuple):
+    round: int
+    round_index: RoundIndex
+    pairing: int
+    side: int
+    opponent: UUID | None
+    team_game_result: FinalizedTeamGameResult
+
+
+class TeamCrossTable:
+    def __init__(self) -> None:
+        self.rounds: list[RoundIndex] = []
+        self.games: dict[UUID, dict[int, TeamCrossTableEntry]] = {}
+        self.head_to_head: dict[tuple[UUID, UUID], dict[int, TeamCrossTableEntry]] = {}
+
+    @classmethod
+    def from_rounds(cls, rounds: Iterable[TeamRoundResult]) -> Self:
+        team_cross_table = cls()
+        for team_round_result in rounds:
+            team_cross_table.add_round(team_round_result)
+        return team_cross_table
+
+    def _set_entry(self, uuid: UUID | None, entry: TeamCrossTableEntry) -> None:
+        if uuid is None:
+            return
+        self.games.setdefault(uuid, {})[entry.round] = entry
+        if entry.opponent is not None:
+            self.head_to_head.setdefault((uuid, entry.opponent), {})[entry.round] = entry
+
+    def add_round(self, team_round_result: TeamRoundResult) -> None:
+        self.rounds.append(team_round_result.index)
+        for pairing, team_game_result in enumerate(team_round_result.items):
+            self.set_team_game_result(len(self.rounds) - 1, pairing, team_game_result)
+
+    def set_team_game_result(
+            self,
+            round_position: int,
+            pairing: int,
+            team_game_result: FinalizedTeamGameResult
+    ) -> None:
+        if TeamGameResult.is_empty(team_game_result):
+            return
+        round_index = self.rounds[round_position]
+        team_1 = team_game_result.team_1
+        team_2 = team_game_result.team_2
+        self._set_entry(team_1, TeamCrossTableEntry(round_position, round_index, pairing, 1, team_2, team_game_result))
+        self._set_entry(team_2, TeamCrossTableEntry(round_position, round_index, pairing, 2, team_1, team_game_result))
+
+    def get_games(self, uuid: UUID) -> list[TeamCrossTableEntry]:
+        return list(self.games.get(uuid, {}).values())
+
+    def get_head_to_head(self, uuid: UUID, uuid_opp: UUID) -> list[TeamCrossTableEntry]:
+        return list(self.head_to_head.get((uuid, uuid_opp), {}).values())
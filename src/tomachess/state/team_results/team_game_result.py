@@ -6,6 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from tomachess.exceptions import ResultError
+from tomachess.models import Trusted
 from tomachess.state.results import FinalizedGameResult, GameResult, IndividualResult
 from tomachess.state.team_pairings import FinalizedTeamPairing
 
@@ -55,18 +56,19 @@ class TeamGameResult(BaseModel):
     @classmethod
     def from_team_pairing(cls, team_pairing: FinalizedTeamPairing) -> Self:
         items = tuple(GameResult.from_game_pairing(item) for item in team_pairing.items)
-        return cls(team_1=team_pairing.team_1, team_2=team_pairing.team_2, items=items)
+        return Trusted.construct(cls, team_1=team_pairing.team_1, team_2=team_pairing.team_2, items=items)
 
     @classmethod
     def get_empty_instance(cls) -> Self:
-        return cls(team_1=None, team_2=None, items=())
+        return Trusted.construct(cls, team_1=None, team_2=None, items=())
 
     def _calculate_results(self, board_scoring_system: ScoringSystem) -> tuple[IndividualResult, IndividualResult]:
         if not TeamGameResult.is_finalized(self):
             raise ResultError("The results are not finalized")
 
-        score_1 = sum(board_scoring_system.get_points(item.result_1) for item in self.items)
-        score_2 = sum(board_scoring_system.get_points(item.result_2) for item in self.items)
+        points = board_scoring_system.get_compiled().points
+        score_1 = sum(points[item.result_1] for item in self.items)
+        score_2 = sum(points[item.result_2] for item in self.items)
 
         if score_1 == score_2:
             return IndividualResult.DRAW, IndividualResult.DRAW
@@ -76,7 +78,7 @@ class TeamGameResult(BaseModel):
 
     def get_team_pairing(self) -> FinalizedTeamPairing:
         items = tuple(GameResult.get_game_pairing(item) for item in self.items)
-        return FinalizedTeamPairing(team_1=self.team_1, team_2=self.team_2, items=items)
+        return Trusted.construct(FinalizedTeamPairing, team_1=self.team_1, team_2=self.team_2, items=items)
 
     def get_game_result(self, board_scoring_system: ScoringSystem) -> FinalizedGameResult:
         results = TeamGameResult._determine_result(self.items)
@@ -85,7 +87,9 @@ class TeamGameResult(BaseModel):
         else:
             result_1, result_2 = results
 
-        return FinalizedGameResult(uuid_1=self.team_1, uuid_2=self.team_2, result_1=result_1, result_2=result_2)
+        return Trusted.construct(
+            FinalizedGameResult, uuid_1=self.team_1, uuid_2=self.team_2, result_1=result_1, result_2=result_2
+        )
 
 
 class FinalizedTeamGameResult(TeamGameResult):
@@ -93,3 +97,5 @@ class FinalizedTeamGameResult(TeamGameResult):
     team_2: UUID | None
     items: tuple[FinalizedGameResult, ...]
 
+    model_config = {"frozen": True}
+
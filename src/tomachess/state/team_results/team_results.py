@@ -1,11 +1,47 @@
-from pydantic import Field
+from typing import Self
+from uuid import UUID
 
-from tomachess.models import State
+from pydantic import Field, PrivateAttr
+
+from tomachess.models import State, Trusted
+from tomachess.state.team_results.compact_team_rounds import CompactTeamRounds
+from tomachess.state.team_results.team_cross_table import TeamCrossTable, TeamCrossTableEntry
+from tomachess.state.team_results.team_game_result import FinalizedTeamGameResult
 from tomachess.state.team_results.team_round_result import TeamRoundResult
 
 
 class TeamResults(State):
-    rounds: list[TeamRoundResult] = Field(default_factory=list)
+    rounds: CompactTeamRounds = Field(default_factory=CompactTeamRounds)
+
+    _cross_table: TeamCrossTable | None = PrivateAttr(default=None)
 
     def __len__(self) -> int:
         return len(self.rounds)
+
+    def get_cross_table(self) -> TeamCrossTable:
+        if self._cross_table is None or len(self._cross_table.rounds) != len(self.rounds):
+            self._cross_table = TeamCrossTable.from_rounds(self.rounds)
+        return self._cross_table
+
+    def get_games(self, uuid: UUID) -> list[TeamCrossTableEntry]:
+        return self.get_cross_table().get_games(uuid)
+
+    def get_head_to_head(self, uuid: UUID, uuid_opp: UUID) -> list[TeamCrossTableEntry]:
+        return self.get_cross_table().get_head_to_head(uuid, uuid_opp)
+
+    def get_snapshot(self) -> Self:
+        return Trusted.construct(type(self), rounds=self.rounds.get_snapshot())
+
+    def add_round(self, team_round_result: TeamRoundResult) -> None:
+        cross_table = self.get_cross_table()
+        self.rounds.append(team_round_result)
+        cross_table.add_round(team_round_result)
+
+    def pop_round(self) -> TeamRoundResult:
+        self._cross_table = None
+        return self.rounds.pop()
+
+    def set_team_game_result(self, index: int, team_game_result: FinalizedTeamGameResult) -> None:
+        cross_table = self.get_cross_table()
+        self.rounds.set_current(self.rounds[-1].with_item(index, team_game_result))
+        cross_table.set_team_game_result(len(self.rounds) - 1, index, team_game_result)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Self
 
 from pydantic import BaseModel
 
+from tomachess.models import Trusted
 from tomachess.state.results import FinalizedRoundResult
 from tomachess.state.team_pairings import TeamParings
 from tomachess.state.team_results.team_game_result import FinalizedTeamGameResult
@@ -15,7 +16,9 @@ if TYPE_CHECKING:
 
 class TeamRoundResult(BaseModel):
     index: RoundIndex
-    items: list[FinalizedTeamGameResult]
+    items: tuple[FinalizedTeamGameResult, ...]
+
+    model_config = {"frozen": True}
 
     @staticmethod
     def has_empty(team_round_result: TeamRoundResult) -> bool:
@@ -23,9 +26,13 @@ class TeamRoundResult(BaseModel):
 
     @classmethod
     def get_empty_instance(cls, team_pairings: TeamParings) -> Self:
-        items = [FinalizedTeamGameResult.get_empty_instance() for _ in range(len(team_pairings.items))]
-        return cls(index=team_pairings.index, items=items)
+        items = (FinalizedTeamGameResult.get_empty_instance(),) * len(team_pairings.items)
+        return Trusted.construct(cls, index=list(team_pairings.index), items=items)
+
+    def with_item(self, index: int, team_game_result: FinalizedTeamGameResult) -> Self:
+        items = self.items[:index] + (team_game_result,) + self.items[index + 1:]
+        return self.model_copy(update={"items": items})
 
     def get_round_result(self, board_scoring_system: ScoringSystem) -> FinalizedRoundResult:
         items = tuple(item.get_game_result(board_scoring_system) for item in self.items)
-        return FinalizedRoundResult(index=self.index, items=items)
+        return Trusted.construct(FinalizedRoundResult, index=list(self.index), items=items)
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any, Sequence, Type, TypeVar, cast
 
+from pydantic import TypeAdapter
+
 from tomachess.models import Entity
 from tomachess.participant import Player, Team
 from tomachess.store.abstract_store import AbstractStore
@@ -42,7 +44,8 @@ class JsonStore(AbstractStore):
     def _load_models(self, folder: str, collection: str, model_cls: Type[T]) -> list[T]:
         path = self._get_file_path(folder, collection)
         data = self._load_json(path)
-        return [model_cls(**item) for item in data.values()]
+        adapter = TypeAdapter(model_cls)
+        return [adapter.validate_python(item) for item in data.values()]
 
     def save_players(self, collection: str, players: Sequence[Player]) -> None:
         self._save_models("players", collection, players)
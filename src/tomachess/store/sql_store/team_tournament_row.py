@@ -2,11 +2,14 @@ import json
 from typing import Self
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlmodel import Field, Relationship, SQLModel
 
 from tomachess.store.sql_store.team_row import TournamentTeamRow
 from tomachess.union_type import TeamTournament
 
+_TEAM_TOURNAMENT_ADAPTER: TypeAdapter[TeamTournament] = TypeAdapter(TeamTournament)
+
 
 class TeamTournamentRow(SQLModel, table=True):
     collection: str
@@ -39,4 +42,4 @@ class TeamTournamentRow(SQLModel, table=True):
             "parameters": json.loads(self.parameters),
             "states": json.loads(self.states)
         }
-        return TeamTournament.model_validate(values)
+        return _TEAM_TOURNAMENT_ADAPTER.validate_python(values)
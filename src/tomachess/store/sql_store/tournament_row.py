@@ -2,11 +2,14 @@ import json
 from typing import Self
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlmodel import Field, Relationship, SQLModel
 
 from tomachess.store.sql_store.player_row import TournamentPlayerRow
 from tomachess.union_type import Tournament
 
+_TOURNAMENT_ADAPTER: TypeAdapter[Tournament] = TypeAdapter(Tournament)
+
 
 class TournamentRow(SQLModel, table=True):
     collection: str
@@ -39,4 +42,4 @@ class TournamentRow(SQLModel, table=True):
             "parameters": json.loads(self.parameters),
             "states": json.loads(self.states)
         }
-        return Tournament.model_validate(values)
+        return _TOURNAMENT_ADAPTER.validate_python(values)
@@ -0,0 +1,5 @@
+from tomachess.tournament.arena.arena_queue import ArenaQueue
+from tomachess.tournament.arena.pairing_engine import ArenaPairingEngine
+from tomachess.tournament.arena.tournament import ArenaTournament
+
+__all__ = ["ArenaPairingEngine", "ArenaQueue", "ArenaTournament"]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Callable
+from uuid import UUID
+
+QueueKey = tuple[float, int, int, UUID]
+
+
+class ArenaQueue:
+    def __init__(self, ratings: dict[UUID, int]) -> None:
+        self.ratings = ratings
+        self.entries: list[QueueKey] = []
+        self.keys: dict[UUID, QueueKey] = {}
+        self.sequence: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, uuid: UUID) -> bool:
+        return uuid in self.keys
+
+    def push(self, uuid: UUID, score: float) -> None:
+        if uuid in self.keys:
+            return
+        key = (-score, -self.ratings.get(uuid, 0), self.sequence, uuid)
+        self.sequence += 1
+        self.keys[uuid] = key
+        insort(self.entries, key)
+
+    def remove(self, uuid: UUID) -> None:
+        key = self.keys.pop(uuid, None)
+        if key is not None:
+            del self.entries[bisect_left(self.entries, key)]
+
+    def pop_pairs(self, is_rematch: Callable[[UUID, UUID], bool]) -> list[tuple[UUID, UUID]]:
+        pairs = []
+        pending: list[UUID] = []
+        for *_, uuid in self.entries:
+            partner = next((other for other in reversed(pending) if not is_rematch(uuid, other)), None)
+            if partner is None:
+                pending.append(uuid)
+                continue
+            pending.remove(partner)
+            pairs.append((partner, uuid))
+        for pair in pairs:
+            for uuid in pair:
+                self.remove(uuid)
+        return pairs
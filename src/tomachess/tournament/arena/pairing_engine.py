@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+from uuid import UUID
+
+from tomachess.classes import PairingBudget, PairingEngine, PairingStateIndex
+from tomachess.models import Trusted
+from tomachess.state import Pairings
+from tomachess.state.pairings import FinalizedGamePairing
+
+if TYPE_CHECKING:
+    from tomachess.tournament.arena.tournament import ArenaTournament
+
+T = TypeVar("T", bound="ArenaTournament")
+
+
+class ArenaPairingEngine(PairingEngine[T], Generic[T]):
+    @staticmethod
+    def _get_game_pairing(
+            pairing_state_index: PairingStateIndex,
+            uuid_1: UUID,
+            uuid_2: UUID
+    ) -> FinalizedGamePairing:
+        if sum(pairing_state_index.get_colours(uuid_2)) < sum(pairing_state_index.get_colours(uuid_1)):
+            uuid_1, uuid_2 = uuid_2, uuid_1
+        return FinalizedGamePairing.from_uuids(uuid_1=uuid_1, uuid_2=uuid_2)
+
+    @classmethod
+    def get_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> Pairings:
+        games = tournament.get_standings_accumulator().games
+
+        def is_rematch(uuid_1: UUID, uuid_2: UUID) -> bool:
+            records = games.get(uuid_1)
+            return records is not None and records[-1][0] == uuid_2
+
+        pairs = tournament.get_queue().pop_pairs(is_rematch)
+        pairing_state_index = tournament.get_pairing_state_index()
+        items = tuple(cls._get_game_pairing(pairing_state_index, uuid_1, uuid_2) for uuid_1, uuid_2 in pairs)
+        return Trusted.construct(Pairings, index=[len(tournament.states.results) + 1], items=items)
@@ -0,0 +1,134 @@
+from typing import Literal, Sequence
+from uuid import UUID
+
+from pydantic import PrivateAttr
+
+from tomachess.base import ParametersBase, StatesBase, TournamentBase, versioned_write
+from tomachess.classes import PairingBudget, PairingSearchResult
+from tomachess.exceptions import NotFoundError, PairingError, ResultError, TournamentPermissionError
+from tomachess.participant import Player
+from tomachess.registry import ParametersRegistry, StatesRegistry, TournamentRegistry
+from tomachess.state.pairings import FinalizedGamePairing
+from tomachess.state.results import GameResult, RoundResult
+from tomachess.tournament.arena.arena_queue import ArenaQueue
+from tomachess.tournament.arena.pairing_engine import ArenaPairingEngine
+
+
+@ParametersRegistry.register
+class ArenaParameters(ParametersBase):
+    type: Literal["arena"] = "arena"
+
+
+@StatesRegistry.register
+class ArenaStates(StatesBase):
+    type: Literal["arena"] = "arena"
+    waiting: set[UUID] = set()
+    games: dict[UUID, FinalizedGamePairing] = {}
+    finished: bool = False
+
+
+@TournamentRegistry.register("arena")
+class ArenaTournament(TournamentBase):
+    pairing_engine = ArenaPairingEngine()
+
+    type: Literal["arena"] = "arena"
+    parameters: ArenaParameters = ArenaParameters()
+    states: ArenaStates = ArenaStates()
+
+    _queue: ArenaQueue | None = PrivateAttr(default=None)
+
+    def get_queue(self) -> ArenaQueue:
+        if self._queue is None:
+            ratings = {participant.uuid: participant.rating or 0 for participant in self.participants}
+            pairing_state_index = self.get_pairing_state_index()
+            self._queue = ArenaQueue(ratings)
+            for uuid in self.states.waiting:
+                self._queue.push(uuid, pairing_state_index.get_score(uuid))
+        return self._queue
+
+    def get_games(self) -> list[FinalizedGamePairing]:
+        return list(self.states.games.values())
+
+    def _get_game_uuid(self, uuid_1: UUID | None, uuid_2: UUID | None) -> UUID:
+        if uuid_1 is None or uuid_1 not in self.states.games or self.states.games[uuid_1].uuid_2.content != uuid_2:
+            raise PairingError("The game is not being played")
+        return uuid_1
+
+    def _get_playing_uuids(self) -> set[UUID | None]:
+        return {item.content for game in self.states.games.values() for item in (game.uuid_1, game.uuid_2)}
+
+    def _enqueue(self, uuids: Sequence[UUID]) -> None:
+        queue = self.get_queue()
+        pairing_state_index = self.get_pairing_state_index()
+        participant_index = self.get_participant_index()
+        for uuid in uuids:
+            if not participant_index.is_active(uuid):
+                continue
+            queue.push(uuid, pairing_state_index.get_score(uuid))
+            self.states.waiting.add(uuid)
+
+    @versioned_write
+    def join(self, participants: Sequence[Player]) -> None:
+        if self.is_finished():
+            raise TournamentPermissionError("The tournament is already finished")
+        uuids = [participant.uuid for participant in participants]
+        participant_index = self.get_participant_index()
+        if not all(participant_index.is_active(uuid) for uuid in uuids):
+            raise NotFoundError("Some participants are not present")
+        playing = self._get_playing_uuids()
+        self._enqueue([uuid for uuid in uuids if uuid not in playing])
+
+    @versioned_write
+    def generate_pairings(
+            self,
+            budget: PairingBudget | None = None,
+            search_result: PairingSearchResult | None = None
+    ) -> PairingSearchResult:
+        if self.is_finished():
+            raise PairingError("The tournament is already finished")
+        search_result = self._search_pairings(budget, search_result)
+        for game in search_result.pairings.items:
+            assert FinalizedGamePairing.is_finalized(game)
+            assert game.uuid_1.content is not None
+            self.states.waiting -= {game.uuid_1.content, game.uuid_2.content}
+            self.states.games[game.uuid_1.content] = game
+        return search_result
+
+    @versioned_write
+    def add_game_result(self, game_result: GameResult) -> None:
+        game_uuid = self._get_game_uuid(game_result.uuid_1, game_result.uuid_2)
+        round_result = RoundResult(index=[len(self.states.results) + 1], items=(game_result,))
+        if not RoundResult.is_valid(round_result):
+            raise ResultError("The game result is invalid")
+        if not RoundResult.is_finalized(round_result):
+            raise ResultError("The game result is missing")
+        accumulator = self.get_standings_accumulator()
+        pairing_state_index = self.get_pairing_state_index()
+        self.states.results.add_round_result(round_result)
+        accumulator.add_round_result(round_result)
+        pairing_state_index.add_round_result(round_result)
+        del self.states.games[game_uuid]
+        if not self.is_finished():
+            self._enqueue([uuid for uuid in (game_result.uuid_1, game_result.uuid_2) if uuid is not None])
+
+    @versioned_write
+    def finish(self) -> None:
+        self.states.finished = True
+        self.states.waiting = set()
+        self._queue = None
+
+    def is_finished(self) -> bool:
+        return self.states.finished
+
+    @versioned_write
+    def drop_out(self, participants: Sequence[Player]) -> None:
+        super().drop_out(participants)
+        queue = self.get_queue()
+        for participant in participants:
+            queue.remove(participant.uuid)
+            self.states.waiting.discard(participant.uuid)
+
+    @versioned_write
+    def drop_in(self, participants: Sequence[Player]) -> None:
+        super().drop_in(participants)
+        self._queue = None
@@ -0,0 +1,5 @@
+from tomachess.tournament.knockout.bracket import KnockoutBracket
+from tomachess.tournament.knockout.pairing_engine import KnockoutPairingEngine
+from tomachess.tournament.knockout.tournament import KnockoutTournament
+
+__all__ = ["KnockoutBracket", "KnockoutPairingEngine", "KnockoutTournament"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Self
+from uuid import UUID
+
+from tomachess.exceptions import NotFoundError
+from tomachess.state import Results
+from tomachess.state.results import FinalizedRoundResult
+
+if TYPE_CHECKING:
+    from tomachess.parameter import ScoringSystem
+
+EMPTY = -1
+
+
+class KnockoutBracket:
+    def __init__(self, seeding: list[UUID], scoring_system: ScoringSystem, games_per_match: int) -> None:
+        self.uuids = seeding
+        self.positions = {uuid: position for position, uuid in enumerate(seeding)}
+        self.points_table = scoring_system.get_compiled().points
+        self.games_per_match = games_per_match
+        self.size = 1 << max(len(seeding) - 1, 1).bit_length()
+        self.nodes: array[int] = array("l", [EMPTY]) * (2 * self.size)
+        self.points: array[float] = array("d", [0.0]) * (2 * self.size)
+        self.games: array[int] = array("H", [0]) * self.size
+        self.locations: array[int] = array("l", [EMPTY]) * len(seeding)
+        self.rounds: int = 0
+        self.round_number: int = 1
+        self.round_games: int = 0
+        self.open_matches: list[int] = []
+        self._place_seeds()
+
+    @classmethod
+    def from_results(
+            cls,
+            seeding: list[UUID],
+            scoring_system: ScoringSystem,
+            games_per_match: int,
+            results: Results
+    ) -> Self:
+        bracket = cls(seeding, scoring_system, games_per_match)
+        for round_result in results.rounds:
+            bracket.add_round_result(round_result)
+        return bracket
+
+    @staticmethod
+    def _get_seed_order(size: int) -> list[int]:
+        order = [0]
+        while len(order) < size:
+            mirror = 2 * len(order) - 1
+            order = [seed for position in order for seed in (position, mirror - position)]
+        return order
+
+    def _place_seeds(self) -> None:
+        for slot, seed in enumerate(self._get_seed_order(self.size)):
+            if seed < len(self.uuids):
+                self.nodes[self.size + slot] = seed
+                self.locations[seed] = self.size + slot
+        first_matches = range(self.size // 2, self.size)
+        for node in first_matches:
+            if self.nodes[2 * node] == EMPTY or self.nodes[2 * node + 1] == EMPTY:
+                self._advance(node, max(self.nodes[2 * node], self.nodes[2 * node + 1]))
+        self.open_matches = [node for node in first_matches if self.nodes[node] == EMPTY]
+        if not self.open_matches:
+            self._next_round()
+
+    def _advance(self, node: int, seed: int) -> None:
+        self.nodes[node] = seed
+        if seed != EMPTY:
+            self.locations[seed] = node
+
+    def _next_round(self) -> None:
+        self.open_matches = []
+        while not self.open_matches and self.size >> self.round_number > 1:
+            self.round_number += 1
+            self.round_games = 0
+            level = range(self.size >> self.round_number, self.size >> (self.round_number - 1))
+            self.open_matches = [node for node in level if self.nodes[node] == EMPTY]
+
+    def _decide(self, node: int) -> bool:
+        if self.games[node] < self.games_per_match:
+            return False
+        points_1, points_2 = self.points[2 * node], self.points[2 * node + 1]
+        if points_1 == points_2:
+            return False
+        self._advance(node, self.nodes[2 * node] if points_1 > points_2 else self.nodes[2 * node + 1])
+        return True
+
+    def is_synchronized(self, results: Results) -> bool:
+        return self.rounds == len(results)
+
+    def add_round_result(self, round_result: FinalizedRoundResult) -> None:
+        for game in round_result.items:
+            match_node = EMPTY
+            for uuid, result in ((game.uuid_1, game.result_1), (game.uuid_2, game.result_2)):
+                if uuid is None:
+                    continue
+                location = self.locations[self.positions[uuid]]
+                self.points[location] += self.points_table[result]
+                match_node = location >> 1
+            if match_node != EMPTY:
+                self.games[match_node] += 1
+        self.rounds += 1
+        self.round_games += 1
+        self.open_matches = [node for node in self.open_matches if not self._decide(node)]
+        if not self.open_matches:
+            self._next_round()
+
+    def get_node(self, round_number: int, board: int) -> int:
+        node = (self.size >> round_number) + board
+        if not self.size >> round_number <= node < self.size >> (round_number - 1):
+            raise NotFoundError(f"There is no board {board} in round {round_number}")
+        return node
+
+    def get_occupant(self, node: int) -> UUID | None:
+        seed = self.nodes[node]
+        return None if seed == EMPTY else self.uuids[seed]
+
+    def get_players(self, node: int) -> tuple[UUID | None, UUID | None]:
+        return self.get_occupant(2 * node), self.get_occupant(2 * node + 1)
+
+    def get_opponent_node(self, node: int) -> int:
+        return node ^ 1
+
+    def get_next_node(self, node: int) -> int:
+        return node >> 1
+
+    def get_match_node(self, uuid: UUID) -> int:
+        return self.locations[self.positions[uuid]] >> 1
+
+    def get_winner(self) -> UUID | None:
+        return self.get_occupant(1)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from tomachess.classes import PairingBudget, PairingEngine
+from tomachess.models import Trusted
+from tomachess.state import Pairings
+from tomachess.state.pairings import FinalizedGamePairing
+
+if TYPE_CHECKING:
+    from tomachess.tournament.knockout.tournament import KnockoutTournament
+
+T = TypeVar("T", bound="KnockoutTournament")
+
+
+class KnockoutPairingEngine(PairingEngine[T], Generic[T]):
+    @classmethod
+    def get_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> Pairings:
+        bracket = tournament.get_bracket()
+        items = []
+        for node in bracket.open_matches:
+            uuid_1, uuid_2 = bracket.get_players(node)
+            if bracket.games[node] % 2 == 1:
+                uuid_1, uuid_2 = uuid_2, uuid_1
+            items.append(FinalizedGamePairing.from_uuids(uuid_1=uuid_1, uuid_2=uuid_2))
+        return Trusted.construct(Pairings, index=[bracket.round_number, bracket.round_games + 1], items=tuple(items))
@@ -0,0 +1,79 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import PrivateAttr
+
+from tomachess.base import ParametersBase, StatesBase, TournamentBase, versioned_write
+from tomachess.classes import PairingBudget, PairingSearchResult
+from tomachess.registry import ParametersRegistry, StatesRegistry, TournamentRegistry
+from tomachess.state.results import RoundResult
+from tomachess.tournament.knockout.bracket import KnockoutBracket
+from tomachess.tournament.knockout.pairing_engine import KnockoutPairingEngine
+
+
+@ParametersRegistry.register
+class KnockoutParameters(ParametersBase):
+    type: Literal["knockout"] = "knockout"
+    games_per_match: int = 2
+    seed_by_rating: bool = True
+
+
+@StatesRegistry.register
+class KnockoutStates(StatesBase):
+    type: Literal["knockout"] = "knockout"
+    seeding: list[UUID] = []
+
+
+@TournamentRegistry.register("knockout")
+class KnockoutTournament(TournamentBase):
+    pairing_engine = KnockoutPairingEngine()
+
+    type: Literal["knockout"] = "knockout"
+    parameters: KnockoutParameters = KnockoutParameters()
+    states: KnockoutStates = KnockoutStates()
+
+    _bracket: KnockoutBracket | None = PrivateAttr(default=None)
+
+    def _get_seeding(self) -> list[UUID]:
+        participant_index = self.get_participant_index()
+        participants = participant_index.get_participants(participant_index.get_active_bits())
+        if self.parameters.seed_by_rating:
+            participants.sort(key=lambda participant: -(participant.rating or 0))
+        return [participant.uuid for participant in participants]
+
+    def get_bracket(self) -> KnockoutBracket:
+        bracket = self._bracket
+        if bracket is None or not bracket.is_synchronized(self.states.results):
+            seeding = self.states.seeding or self._get_seeding()
+            scoring_system = self.parameters.scoring_system
+            games_per_match = self.parameters.games_per_match
+            bracket = KnockoutBracket.from_results(seeding, scoring_system, games_per_match, self.states.results)
+            self._bracket = bracket
+        return bracket
+
+    def get_winner(self) -> UUID | None:
+        return self.get_bracket().get_winner()
+
+    @versioned_write
+    def generate_pairings(
+            self,
+            budget: PairingBudget | None = None,
+            search_result: PairingSearchResult | None = None
+    ) -> PairingSearchResult:
+        if not self.states.seeding:
+            self.states.seeding = self._get_seeding()
+            self._bracket = None
+        return super().generate_pairings(budget, search_result)
+
+    @versioned_write
+    def add_round_result(self, round_result: RoundResult) -> None:
+        bracket = self.get_bracket()
+        super().add_round_result(round_result)
+        assert RoundResult.is_finalized(round_result)
+        bracket.add_round_result(round_result)
+
+    def is_finished(self) -> bool:
+        return not self.get_bracket().open_matches
+
+    def is_drop_in_allowed(self) -> bool:
+        return not self.states.seeding
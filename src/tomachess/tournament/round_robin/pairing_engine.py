@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Generic, TypeVar
 from uuid import UUID
 
-from tomachess.classes import PairingEngine
+from tomachess.classes import PairingBudget, PairingEngine
+from tomachess.models import Trusted
 from tomachess.state import Pairings
 from tomachess.state.pairings import FinalizedGamePairing
 
@@ -13,17 +15,22 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="RoundRobinTournament | RoundRobinTeamTournament")
 
+BergerTable = tuple[tuple[tuple[int, int], ...], ...]
+
 
 class RoundRobinPairingEngine(PairingEngine[T], Generic[T]):
     @staticmethod
-    def _get_cycle(tournament: T) -> int:
+    def _get_rounds_per_cycle(tournament: T) -> int:
         even = len(tournament.participants) % 2 == 0
-        return len(tournament.states.results) // (len(tournament.participants) - even) + 1
+        return len(tournament.participants) - even
 
     @staticmethod
-    def _get_modulo_round(tournament: T) -> int:
-        even = len(tournament.participants) % 2 == 0
-        return len(tournament.states.results) % (len(tournament.participants) - even) + 1
+    def _get_cycle(tournament: T, round_position: int) -> int:
+        return round_position // RoundRobinPairingEngine._get_rounds_per_cycle(tournament) + 1
+
+    @staticmethod
+    def _get_modulo_round(tournament: T, round_position: int) -> int:
+        return round_position % RoundRobinPairingEngine._get_rounds_per_cycle(tournament) + 1
 
     @staticmethod
     def _get_berger_indices(participant_number: int, round_number: int) -> list[tuple[int, int]]:
@@ -47,6 +54,14 @@ class RoundRobinPairingEngine(PairingEngine[T], Generic[T]):
 
         return pairs
 
+    @staticmethod
+    @cache
+    def _get_berger_table(participant_number: int) -> BergerTable:
+        return tuple(
+            tuple(RoundRobinPairingEngine._get_berger_indices(participant_number, round_number))
+            for round_number in range(1, participant_number)
+        )
+
     @staticmethod
     def _get_pairing(indices: tuple[int, int], uuids: list[UUID]) -> tuple[UUID | None, UUID | None]:
         match (indices[0] > len(uuids), indices[1] > len(uuids)):
@@ -59,25 +74,40 @@ class RoundRobinPairingEngine(PairingEngine[T], Generic[T]):
             case _:
                 assert False
 
+    @staticmethod
+    def _get_seeding(tournament: T) -> list[UUID]:
+        return [participant.uuid for participant in tournament.participants]
+
     @classmethod
-    def get_pairings(cls, tournament: T) -> Pairings:
-        uuids = list(tournament.get_participant_uuids())
+    def _get_round_pairings(cls, tournament: T, uuids: list[UUID], round_position: int) -> Pairings:
         participant_number = len(uuids)
         odd = participant_number % 2
-        cycle = cls._get_cycle(tournament)
-        round_number = cls._get_modulo_round(tournament)
-        pairing_indices = cls._get_berger_indices(participant_number + odd, round_number)
+        cycle = cls._get_cycle(tournament, round_position)
+        round_number = cls._get_modulo_round(tournament, round_position)
+        pairing_indices = cls._get_berger_table(participant_number + odd)[round_number - 1]
 
         if cycle % 2 == 0:
-            pairing_indices = [indices[::-1] for indices in pairing_indices]
+            pairing_indices = tuple(indices[::-1] for indices in pairing_indices)
 
         if tournament.parameters.cycles == 1:
             round_index = [round_number]
         else:
             round_index = [cycle, round_number]
 
-        pairing_indices = [(a, b) for a, b in pairing_indices if a <= participant_number and b <= participant_number]
+        pairing_indices = tuple(
+            (a, b) for a, b in pairing_indices if a <= participant_number and b <= participant_number
+        )
         pairing_uuids = tuple(cls._get_pairing(indices, uuids) for indices in pairing_indices)
         items = tuple(FinalizedGamePairing.from_uuids(uuid_1=uuid_1, uuid_2=uuid_2) for uuid_1, uuid_2 in pairing_uuids)
 
-        return Pairings(index=round_index, items=items)
+        return Trusted.construct(Pairings, index=round_index, items=items)
+
+    @classmethod
+    def get_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> Pairings:
+        return cls._get_round_pairings(tournament, cls._get_seeding(tournament), len(tournament.states.results))
+
+    @classmethod
+    def get_schedule(cls, tournament: T) -> list[Pairings]:
+        uuids = cls._get_seeding(tournament)
+        round_number = cls._get_rounds_per_cycle(tournament) * tournament.parameters.cycles
+        return [cls._get_round_pairings(tournament, uuids, round_position) for round_position in range(round_number)]
@@ -4,6 +4,7 @@ from tomachess.base import TeamParametersBase, TeamStatesBase,TeamTournamentBase
 from tomachess.parameter import TeamTiebreaks
 from tomachess.parameter.tiebreaks.criteria import BoardPoints, TeamTiebreakCriterium
 from tomachess.registry import ParametersRegistry, StatesRegistry, TeamTournamentRegistry
+from tomachess.state import Pairings
 from tomachess.tournament.round_robin.pairing_engine import RoundRobinPairingEngine
 
 
@@ -26,6 +27,9 @@ class RoundRobinTeamTournament(TeamTournamentBase):
     parameters: RoundRobinTeamParameters = RoundRobinTeamParameters()
     states: RoundRobinTeamStates = RoundRobinTeamStates()
 
+    def get_schedule(self) -> list[Pairings]:
+        return self.pairing_engine.get_schedule(self)
+
     def is_finished(self) -> bool:
         even = len(self.participants) % 2 == 0
         return len(self.states.results) >= (len(self.participants) - even) * self.parameters.cycles
@@ -4,6 +4,7 @@ from tomachess.base import ParametersBase, StatesBase, TournamentBase
 from tomachess.parameter.tiebreaks import Tiebreaks
 from tomachess.parameter.tiebreaks.criteria import SonnebornBerger, TiebreakCriterium
 from tomachess.registry import ParametersRegistry, StatesRegistry, TournamentRegistry
+from tomachess.state import Pairings
 from tomachess.tournament.round_robin.pairing_engine import RoundRobinPairingEngine
 
 
@@ -27,6 +28,9 @@ class RoundRobinTournament(TournamentBase):
     parameters: RoundRobinParameters = RoundRobinParameters()
     states: RoundRobinStates = RoundRobinStates()
 
+    def get_schedule(self) -> list[Pairings]:
+        return self.pairing_engine.get_schedule(self)
+
     def is_finished(self) -> bool:
         even = len(self.participants) % 2 == 0
         return len(self.states.results) >= (len(self.participants) - even) * self.parameters.cycles
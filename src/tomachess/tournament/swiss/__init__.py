@@ -0,0 +1,13 @@
+from tomachess.tournament.swiss.matching import BlossomMatching
+from tomachess.tournament.swiss.pairing_engine import SwissPairingEngine
+from tomachess.tournament.swiss.team_pairing_engine import SwissTeamPairingEngine
+from tomachess.tournament.swiss.team_tournament import SwissTeamTournament
+from tomachess.tournament.swiss.tournament import SwissTournament
+
+__all__ = [
+    "BlossomMatching",
+    "SwissPairingEngine",
+    "SwissTeamPairingEngine",
+    "SwissTeamTournament",
+    "SwissTournament"
+]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Sequence
+
+
+class BlossomMatching:
+    def __init__(self, size: int, is_compatible: Callable[[int, int], bool]) -> None:
+        self.size = size
+        self.is_compatible = is_compatible
+        self.mates: list[int] = [-1] * size
+
+    def add_pair(self, vertex_1: int, vertex_2: int) -> None:
+        self.mates[vertex_1] = vertex_2
+        self.mates[vertex_2] = vertex_1
+
+    def get_pairs(self) -> list[tuple[int, int]]:
+        return [(vertex, mate) for vertex, mate in enumerate(self.mates) if vertex < mate]
+
+    def _get_neighbours(
+            self,
+            vertex: int,
+            positions: dict[int, int],
+            distance: int,
+            adjacency: dict[int, list[int]]
+    ) -> list[int]:
+        neighbours = adjacency.get(vertex)
+        if neighbours is None:
+            position = positions[vertex]
+            neighbours = [other for other in positions if other != vertex and self.is_compatible(vertex, other)]
+            neighbours.sort(key=lambda other: abs(abs(positions[other] - position) - distance))
+            adjacency[vertex] = neighbours
+        return neighbours
+
+    def _find_lca(self, vertex_1: int, vertex_2: int, base: list[int], parents: list[int]) -> int:
+        visited = set()
+        while True:
+            vertex_1 = base[vertex_1]
+            visited.add(vertex_1)
+            if self.mates[vertex_1] == -1:
+                break
+            vertex_1 = parents[self.mates[vertex_1]]
+        while True:
+            vertex_2 = base[vertex_2]
+            if vertex_2 in visited:
+                return vertex_2
+            vertex_2 = parents[self.mates[vertex_2]]
+
+    def _mark_path(
+            self,
+            vertex: int,
+            lca: int,
+            child: int,
+            base: list[int],
+            parents: list[int],
+            blossom: set[int]
+    ) -> None:
+        while base[vertex] != lca:
+            blossom.add(base[vertex])
+            blossom.add(base[self.mates[vertex]])
+            parents[vertex] = child
+            child = self.mates[vertex]
+            vertex = parents[self.mates[vertex]]
+
+    def _find_path(
+            self,
+            root: int,
+            positions: dict[int, int],
+            distance: int,
+            adjacency: dict[int, list[int]]
+    ) -> tuple[int, list[int]]:
+        used = {root}
+        parents = [-1] * self.size
+        base = list(range(self.size))
+        queue = deque([root])
+
+        while queue:
+            vertex = queue.popleft()
+            for other in self._get_neighbours(vertex, positions, distance, adjacency):
+                if base[vertex] == base[other] or self.mates[vertex] == other:
+                    continue
+                if other == root or (self.mates[other] != -1 and parents[self.mates[other]] != -1):
+                    lca = self._find_lca(vertex, other, base, parents)
+                    blossom: set[int] = set()
+                    self._mark_path(vertex, lca, other, base, parents, blossom)
+                    self._mark_path(other, lca, vertex, base, parents, blossom)
+                    for member in positions:
+                        if base[member] in blossom:
+                            base[member] = lca
+                            if member not in used:
+                                used.add(member)
+                                queue.append(member)
+                elif parents[other] == -1:
+                    parents[other] = vertex
+                    if self.mates[other] == -1:
+                        return other, parents
+                    used.add(self.mates[other])
+                    queue.append(self.mates[other])
+
+        return -1, parents
+
+    def _augment(self, vertex: int, parents: list[int]) -> None:
+        while vertex != -1:
+            parent = parents[vertex]
+            next_vertex = self.mates[parent]
+            self.add_pair(vertex, parent)
+            vertex = next_vertex
+
+    def maximize(self, vertices: Sequence[int], distance: int = 0) -> list[int]:
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+        adjacency: dict[int, list[int]] = {}
+        unmatched = sum(self.mates[vertex] == -1 for vertex in vertices)
+        for vertex in vertices:
+            if unmatched < 2:
+                break
+            if self.mates[vertex] != -1:
+                continue
+            unmatched -= 1
+            end, parents = self._find_path(vertex, positions, distance, adjacency)
+            if end != -1:
+                self._augment(end, parents)
+                unmatched -= 1
+        return [vertex for vertex in vertices if self.mates[vertex] == -1]
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Generic, Iterable, TypeVar
+from uuid import UUID
+
+from tomachess.classes import PairingBudget, PairingEngine, PairingSearchResult, PairingStateIndex
+from tomachess.classes.pairing_state_index import BLACK, DOWNFLOAT, WHITE
+from tomachess.exceptions import PairingError
+from tomachess.models import Trusted
+from tomachess.participant import Participant, Player
+from tomachess.state import Pairings
+from tomachess.state.pairings import FinalizedGamePairing, GamePairing
+from tomachess.tournament.swiss.matching import BlossomMatching
+
+if TYPE_CHECKING:
+    from tomachess.tournament.swiss.team_tournament import SwissTeamTournament
+    from tomachess.tournament.swiss.tournament import SwissTournament
+
+T = TypeVar("T", bound="SwissTournament | SwissTeamTournament")
+
+ABSOLUTE = 3
+FLOAT_WEIGHT = 10.0
+KEPT_BYE_CANDIDATES = 4
+
+ColourPreference = tuple[int, int]
+
+
+class SwissPairingEngine(PairingEngine[T], Generic[T]):
+    @staticmethod
+    def _get_colour_preference(colours: array[int]) -> ColourPreference:
+        if not colours:
+            return 0, 0
+        difference = sum(colours)
+        if difference < -1 or colours[-2:].tolist() == [BLACK, BLACK]:
+            return WHITE, ABSOLUTE
+        if difference > 1 or colours[-2:].tolist() == [WHITE, WHITE]:
+            return BLACK, ABSOLUTE
+        if difference != 0:
+            return (WHITE if difference < 0 else BLACK), 2
+        return -colours[-1], 1
+
+    @staticmethod
+    def _is_first_white(
+            preference_1: ColourPreference,
+            preference_2: ColourPreference,
+            colours_1: array[int],
+            colours_2: array[int],
+            board: int
+    ) -> bool:
+        (colour_1, strength_1), (colour_2, strength_2) = preference_1, preference_2
+        if colour_1 == 0 and colour_2 == 0:
+            return board % 2 == 0
+        if colour_1 != colour_2:
+            return colour_1 == WHITE or colour_2 == BLACK
+        if strength_1 != strength_2:
+            return (colour_1 == WHITE) if strength_1 > strength_2 else (colour_2 == BLACK)
+        for past_1, past_2 in zip(reversed(colours_1), reversed(colours_2)):
+            if past_1 != past_2:
+                return past_1 == BLACK
+        return colour_1 == WHITE
+
+    @classmethod
+    def _get_rating(cls, tournament: T, participant: Participant) -> float:
+        assert isinstance(participant, Player)
+        return participant.rating or 0
+
+    @classmethod
+    def _get_secondary_scores(cls, tournament: T, uuids: list[UUID]) -> dict[UUID, float]:
+        return {}
+
+    @classmethod
+    def _get_seeding(cls, tournament: T, pairing_state_index: PairingStateIndex) -> list[UUID]:
+        participant_index = tournament.get_participant_index()
+        participants = participant_index.get_participants(participant_index.get_pairable_bits())
+        secondary_scores = cls._get_secondary_scores(tournament, [participant.uuid for participant in participants])
+        participants.sort(key=lambda participant: (
+            -pairing_state_index.get_score(participant.uuid),
+            -secondary_scores.get(participant.uuid, 0.0),
+            -cls._get_rating(tournament, participant)
+        ))
+        return [participant.uuid for participant in participants]
+
+    @staticmethod
+    def _get_brackets(uuids: list[UUID], pairing_state_index: PairingStateIndex) -> list[list[int]]:
+        scores = [pairing_state_index.get_score(uuid) for uuid in uuids]
+        brackets: list[list[int]] = []
+        for rank in range(len(uuids)):
+            if rank == 0 or scores[rank] != scores[rank - 1]:
+                brackets.append([])
+            brackets[-1].append(rank)
+        return brackets
+
+    @staticmethod
+    def _get_bye_candidates(uuids: list[UUID], pairing_state_index: PairingStateIndex) -> list[UUID]:
+        return sorted(reversed(uuids), key=pairing_state_index.get_bye_count)
+
+    @staticmethod
+    def _order_floater(vertices: list[int], downfloated: list[bool]) -> list[int]:
+        if len(vertices) % 2 == 0:
+            return vertices
+        floater = next((vertex for vertex in reversed(vertices) if not downfloated[vertex]), vertices[-1])
+        return [vertex for vertex in vertices if vertex != floater] + [floater]
+
+    @classmethod
+    def _pair_brackets(cls, matching: BlossomMatching, brackets: list[list[int]], downfloated: list[bool]) -> list[int]:
+        floaters: list[int] = []
+        for bracket in brackets:
+            vertices = cls._order_floater(floaters + bracket, downfloated)
+            half = len(vertices) // 2
+            for position in range(half):
+                if matching.is_compatible(vertices[position], vertices[position + half]):
+                    matching.add_pair(vertices[position], vertices[position + half])
+            floaters = matching.maximize(vertices, half)
+        return floaters
+
+    @staticmethod
+    def _repair(matching: BlossomMatching, floaters: list[int], fixed: set[int]) -> list[int]:
+        window = len(floaters)
+        while floaters:
+            start = max(0, min(floaters) - window)
+            vertices = set(range(start, matching.size)) - fixed
+            vertices |= {matching.mates[vertex] for vertex in vertices if matching.mates[vertex] != -1}
+            floaters = matching.maximize(sorted(vertices))
+            if start == 0:
+                break
+            window *= 2
+        return floaters
+
+    @classmethod
+    def _get_matching(
+            cls,
+            uuids: list[UUID],
+            brackets: list[list[int]],
+            pairing_state_index: PairingStateIndex,
+            preferences: list[ColourPreference],
+            strict_colours: bool,
+            fixed_pairs: Iterable[tuple[int, int]] = (),
+            keep_fixed: bool = True
+    ) -> BlossomMatching | None:
+        rank_opponents = [pairing_state_index.get_opponents(uuid) for uuid in uuids]
+        downfloated = [pairing_state_index.get_floats(uuid)[-1:].tolist() == [DOWNFLOAT] for uuid in uuids]
+
+        def is_compatible(rank_1: int, rank_2: int) -> bool:
+            if uuids[rank_2] in rank_opponents[rank_1]:
+                return False
+            if not strict_colours:
+                return True
+            return preferences[rank_1][1] < ABSOLUTE or preferences[rank_1] != preferences[rank_2]
+
+        matching = BlossomMatching(len(uuids), is_compatible)
+        for rank_1, rank_2 in fixed_pairs:
+            matching.add_pair(rank_1, rank_2)
+        fixed = {rank for rank in range(len(uuids)) if matching.mates[rank] != -1} if keep_fixed else set()
+        free_brackets = [[rank for rank in bracket if matching.mates[rank] == -1] for bracket in brackets]
+        floaters = cls._pair_brackets(matching, free_brackets, downfloated)
+        if cls._repair(matching, floaters, fixed):
+            return None
+        return matching
+
+    @classmethod
+    def _match(
+            cls,
+            uuids: list[UUID],
+            pairing_state_index: PairingStateIndex,
+            preferences: list[ColourPreference],
+            fixed_pairs: Iterable[tuple[int, int]],
+            keep_fixed: bool
+    ) -> BlossomMatching | None:
+        brackets = cls._get_brackets(uuids, pairing_state_index)
+        for strict_colours in (True, False):
+            matching = cls._get_matching(
+                uuids, brackets, pairing_state_index, preferences, strict_colours, fixed_pairs, keep_fixed
+            )
+            if matching is not None:
+                return matching
+        return None
+
+    @staticmethod
+    def _get_penalty(scores: list[float], preferences: list[ColourPreference], rank_1: int, rank_2: int) -> float:
+        penalty = FLOAT_WEIGHT * abs(scores[rank_1] - scores[rank_2])
+        (colour_1, strength_1), (colour_2, strength_2) = preferences[rank_1], preferences[rank_2]
+        if colour_1 != 0 and colour_1 == colour_2:
+            penalty += min(strength_1, strength_2)
+        return penalty
+
+    @staticmethod
+    def _get_lower_bound(scores: list[float], ranks: list[int]) -> float:
+        ordered = sorted((scores[rank] for rank in ranks), reverse=True)
+        differences = (ordered[position] - ordered[position + 1] for position in range(0, len(ordered) - 1, 2))
+        return FLOAT_WEIGHT * sum(differences)
+
+    @classmethod
+    def _improve(
+            cls,
+            matching: BlossomMatching,
+            scores: list[float],
+            preferences: list[ColourPreference],
+            fixed_pairs: Iterable[tuple[int, int]],
+            budget: PairingBudget
+    ) -> int:
+        fixed = {rank for pair in fixed_pairs for rank in pair}
+        iterations = 0
+        improved = True
+        while improved:
+            improved = False
+            pairs = [pair for pair in matching.get_pairs() if pair[0] not in fixed]
+            groups: dict[float, list[tuple[int, int]]] = {}
+            for pair in pairs:
+                for score in {scores[pair[0]], scores[pair[1]]}:
+                    groups.setdefault(score, []).append(pair)
+            for rank_1, rank_2 in pairs:
+                if matching.mates[rank_1] != rank_2:
+                    continue
+                penalty = cls._get_penalty(scores, preferences, rank_1, rank_2)
+                if penalty == 0:
+                    continue
+                candidates = groups[scores[rank_1]] + groups[scores[rank_2]]
+                for rank_3, rank_4 in candidates:
+                    if not budget.consume():
+                        return iterations
+                    iterations += 1
+                    if rank_3 in (rank_1, rank_2) or matching.mates[rank_3] != rank_4:
+                        continue
+                    current = penalty + cls._get_penalty(scores, preferences, rank_3, rank_4)
+                    for rank_5, rank_6 in ((rank_3, rank_4), (rank_4, rank_3)):
+                        if not matching.is_compatible(rank_1, rank_5) or not matching.is_compatible(rank_2, rank_6):
+                            continue
+                        swapped = cls._get_penalty(scores, preferences, rank_1, rank_5)
+                        swapped += cls._get_penalty(scores, preferences, rank_2, rank_6)
+                        if swapped < current:
+                            matching.add_pair(rank_1, rank_5)
+                            matching.add_pair(rank_2, rank_6)
+                            improved = True
+                            break
+                    if matching.mates[rank_1] != rank_2:
+                        break
+        return iterations
+
+    @classmethod
+    def _create_pairings(
+            cls,
+            uuids: list[UUID],
+            pairs: list[tuple[int, int]],
+            pairing_state_index: PairingStateIndex,
+            preferences: list[ColourPreference],
+            fixed_pairs: dict[tuple[int, int], GamePairing]
+    ) -> list[GamePairing]:
+        items: list[GamePairing] = []
+        for board, (rank_1, rank_2) in enumerate(sorted(pairs)):
+            if (rank_1, rank_2) in fixed_pairs:
+                items.append(fixed_pairs[rank_1, rank_2])
+                continue
+            uuid_1, uuid_2 = uuids[rank_1], uuids[rank_2]
+            colours_1, colours_2 = pairing_state_index.get_colours(uuid_1), pairing_state_index.get_colours(uuid_2)
+            if not cls._is_first_white(preferences[rank_1], preferences[rank_2], colours_1, colours_2, board):
+                uuid_1, uuid_2 = uuid_2, uuid_1
+            items.append(FinalizedGamePairing.from_uuids(uuid_1=uuid_1, uuid_2=uuid_2))
+        return items
+
+    @staticmethod
+    def _get_fixed_items(pairings: Pairings, uuids: list[UUID]) -> dict[tuple[UUID, UUID], GamePairing]:
+        active = set(uuids)
+        fixed_items: dict[tuple[UUID, UUID], GamePairing] = {}
+        for item in pairings.items:
+            if not GamePairing.is_finalized(item):
+                continue
+            uuid_1, uuid_2 = item.uuid_1.content, item.uuid_2.content
+            if uuid_1 in active and uuid_2 in active:
+                assert uuid_1 is not None and uuid_2 is not None
+                fixed_items[uuid_1, uuid_2] = item
+        return fixed_items
+
+    @classmethod
+    def _pair(
+            cls,
+            tournament: T,
+            pairing_state_index: PairingStateIndex,
+            uuids: list[UUID],
+            fixed_items: dict[tuple[UUID, UUID], GamePairing],
+            budget: PairingBudget | None = None
+    ) -> PairingSearchResult:
+        fixed_uuids = {uuid for key in fixed_items for uuid in key}
+        bye_uuids = sorted(tournament.states.byes - tournament.states.drop_outs, key=str)
+        all_preferences = {
+            uuid: cls._get_colour_preference(pairing_state_index.get_colours(uuid)) for uuid in uuids
+        }
+
+        bye_candidates: list[UUID | None] = [None]
+        if len(uuids) % 2 == 1:
+            free_uuids = [uuid for uuid in uuids if uuid not in fixed_uuids]
+            bye_candidates = list(cls._get_bye_candidates(free_uuids, pairing_state_index))
+
+        kept_candidates = bye_candidates[:KEPT_BYE_CANDIDATES] if fixed_items else bye_candidates
+        attempts = [(True, bye_uuid) for bye_uuid in kept_candidates]
+        if fixed_items:
+            attempts.extend((False, bye_uuid) for bye_uuid in bye_candidates)
+
+        matching = None
+        for keep_fixed, bye_uuid in attempts:
+            paired_uuids = [uuid for uuid in uuids if uuid != bye_uuid]
+            ranks = {uuid: rank for rank, uuid in enumerate(paired_uuids)}
+            fixed_pairs = {
+                (min(ranks[uuid_1], ranks[uuid_2]), max(ranks[uuid_1], ranks[uuid_2])): item
+                for (uuid_1, uuid_2), item in fixed_items.items()
+            }
+            preferences = [all_preferences[uuid] for uuid in paired_uuids]
+            matching = cls._match(paired_uuids, pairing_state_index, preferences, fixed_pairs, keep_fixed)
+            if matching is not None:
+                break
+        if matching is None:
+            raise PairingError("No pairing without repeated games exists")
+        uuids = paired_uuids
+        fixed_pairs = {pair: item for pair, item in fixed_pairs.items() if matching.mates[pair[0]] == pair[1]}
+
+        scores = [pairing_state_index.get_score(uuid) for uuid in uuids]
+        iterations = 0 if budget is None else cls._improve(matching, scores, preferences, fixed_pairs, budget)
+        pairs = matching.get_pairs()
+        penalty = sum(cls._get_penalty(scores, preferences, rank_1, rank_2) for rank_1, rank_2 in pairs)
+        fixed_penalty = sum(cls._get_penalty(scores, preferences, rank_1, rank_2) for rank_1, rank_2 in fixed_pairs)
+        free_ranks = [rank for rank in range(len(uuids)) if all(rank not in pair for pair in fixed_pairs)]
+        lower_bound = fixed_penalty + cls._get_lower_bound(scores, free_ranks)
+
+        items = cls._create_pairings(uuids, pairs, pairing_state_index, preferences, fixed_pairs)
+        if bye_uuid is not None:
+            items.append(FinalizedGamePairing.from_uuids(uuid_1=bye_uuid, uuid_2=None, bye_2=True))
+        items.extend(FinalizedGamePairing.from_uuids(uuid_1=uuid, uuid_2=None) for uuid in bye_uuids)
+        pairings = Trusted.construct(Pairings, index=[len(tournament.states.results) + 1], items=tuple(items))
+        return PairingSearchResult(
+            pairings=pairings,
+            penalty=penalty,
+            optimal=penalty <= lower_bound,
+            iterations=iterations
+        )
+
+    @classmethod
+    def search_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> PairingSearchResult:
+        if budget is not None:
+            budget.start()
+        pairing_state_index = tournament.get_pairing_state_index()
+        uuids = cls._get_seeding(tournament, pairing_state_index)
+        return cls._pair(tournament, pairing_state_index, uuids, {}, budget)
+
+    @classmethod
+    def get_pairings(cls, tournament: T, budget: PairingBudget | None = None) -> Pairings:
+        return cls.search_pairings(tournament, budget).pairings
+
+    @classmethod
+    def update_pairings(cls, tournament: T, pairings: Pairings) -> Pairings:
+        pairing_state_index = tournament.get_pairing_state_index()
+        uuids = cls._get_seeding(tournament, pairing_state_index)
+        return cls._pair(tournament, pairing_state_index, uuids, cls._get_fixed_items(pairings, uuids)).pairings
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Generic, TypeVar
+from uuid import UUID
+
+from tomachess.classes import StandingsContext
+from tomachess.classes.pairing_state_index import BLACK, WHITE
+from tomachess.participant import Participant, Team
+from tomachess.parameter.tiebreaks.criteria import BoardPoints
+from tomachess.tournament.swiss.pairing_engine import SwissPairingEngine
+
+if TYPE_CHECKING:
+    from tomachess.tournament.swiss.team_tournament import SwissTeamTournament
+
+T = TypeVar("T", bound="SwissTeamTournament")
+
+
+class SwissTeamPairingEngine(SwissPairingEngine[T], Generic[T]):
+    @classmethod
+    def _get_rating(cls, tournament: T, participant: Participant) -> float:
+        assert isinstance(participant, Team)
+        ratings = sorted((member.rating or 0 for member in participant.members), reverse=True)
+        ratings = ratings[:tournament.parameters.boards]
+        return sum(ratings) / len(ratings) if ratings else 0.0
+
+    @classmethod
+    def _get_secondary_scores(cls, tournament: T, uuids: list[UUID]) -> dict[UUID, float]:
+        context = StandingsContext.from_tournament(tournament, incremental=True)
+        return BoardPoints().compute_tiebreak(tournament, context)
+
+    @staticmethod
+    @cache
+    def get_board_colours(boards: int) -> tuple[int, ...]:
+        return tuple(WHITE if board % 2 == 0 else BLACK for board in range(boards))
@@ -0,0 +1,47 @@
+from typing import Literal
+from uuid import UUID
+
+from tomachess.base import TeamParametersBase, TeamStatesBase, TeamTournamentBase
+from tomachess.exceptions import NotFoundError, PairingError
+from tomachess.parameter import TeamTiebreaks
+from tomachess.parameter.tiebreaks.criteria import BoardPoints, TeamTiebreakCriterium
+from tomachess.registry import ParametersRegistry, StatesRegistry, TeamTournamentRegistry
+from tomachess.tournament.swiss.team_pairing_engine import SwissTeamPairingEngine
+
+
+@ParametersRegistry.register
+class SwissTeamParameters(TeamParametersBase):
+    type: Literal["swiss"] = "swiss"
+    tiebreaks: TeamTiebreaks[TeamTiebreakCriterium] = TeamTiebreaks(criteria=[BoardPoints()])
+    rounds: int = 9
+
+
+@StatesRegistry.register
+class SwissTeamStates(TeamStatesBase):
+    type: Literal["swiss_team"] = "swiss_team"
+
+
+@TeamTournamentRegistry.register("swiss")
+class SwissTeamTournament(TeamTournamentBase):
+    pairing_engine = SwissTeamPairingEngine()
+
+    type: Literal["swiss"] = "swiss"
+    parameters: SwissTeamParameters = SwissTeamParameters()
+    states: SwissTeamStates = SwissTeamStates()
+
+    def get_board_colours(self, uuid: UUID) -> tuple[int, ...]:
+        if self.states.team_pairings is None:
+            raise PairingError("No team pairings were generated")
+        colours = self.pairing_engine.get_board_colours(self.parameters.boards)
+        for team_pairing in self.states.team_pairings.items:
+            if team_pairing.team_1 == uuid:
+                return colours
+            if team_pairing.team_2 == uuid:
+                return tuple(-colour for colour in colours)
+        raise NotFoundError("The team is not paired")
+
+    def is_finished(self) -> bool:
+        return len(self.states.results) >= self.parameters.rounds
+
+    def is_taking_byes_allowed(self) -> bool:
+        return True
@@ -0,0 +1,34 @@
+from typing import Literal
+
+from tomachess.base import ParametersBase, StatesBase, TournamentBase
+from tomachess.parameter.tiebreaks import Tiebreaks
+from tomachess.parameter.tiebreaks.criteria import Buchholz, SonnebornBerger, TiebreakCriterium
+from tomachess.registry import ParametersRegistry, StatesRegistry, TournamentRegistry
+from tomachess.tournament.swiss.pairing_engine import SwissPairingEngine
+
+
+@ParametersRegistry.register
+class SwissParameters(ParametersBase):
+    type: Literal["swiss"] = "swiss"
+    tiebreaks: Tiebreaks[TiebreakCriterium] = Tiebreaks(criteria=[Buchholz(), SonnebornBerger()])
+    rounds: int = 9
+
+
+@StatesRegistry.register
+class SwissStates(StatesBase):
+    type: Literal["swiss"] = "swiss"
+
+
+@TournamentRegistry.register("swiss")
+class SwissTournament(TournamentBase):
+    pairing_engine = SwissPairingEngine()
+
+    type: Literal["swiss"] = "swiss"
+    parameters: SwissParameters = SwissParameters()
+    states: SwissStates = SwissStates()
+
+    def is_finished(self) -> bool:
+        return len(self.states.results) >= self.parameters.rounds
+
+    def is_taking_byes_allowed(self) -> bool:
+        return True